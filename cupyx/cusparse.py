@@ -848,21 +848,24 @@ def csrsort(x):
         x.indices.data.ptr)
     buf = _cupy.empty(buffer_size, 'b')
     P = _cupy.empty(nnz, 'i')
-    data_orig = x.data.copy()
     _cusparse.createIdentityPermutation(handle, nnz, P.data.ptr)
     _cusparse.xcsrsort(
         handle, m, n, nnz, x._descr.descriptor, x.indptr.data.ptr,
         x.indices.data.ptr, P.data.ptr, buf.data.ptr)
 
+    # gather the values through the permutation into a fresh buffer instead
+    # of duplicating them up front; the sort itself only permutes indices
+    data_sorted = _cupy.empty_like(x.data)
     if check_availability('gthr'):
         _call_cusparse(
             'gthr', x.dtype,
-            handle, nnz, data_orig.data.ptr, x.data.data.ptr,
+            handle, nnz, x.data.data.ptr, data_sorted.data.ptr,
             P.data.ptr, _cusparse.CUSPARSE_INDEX_BASE_ZERO)
     else:
-        desc_x = SpVecDescriptor.create(P, x.data)
-        desc_y = DnVecDescriptor.create(data_orig)
+        desc_x = SpVecDescriptor.create(P, data_sorted)
+        desc_y = DnVecDescriptor.create(x.data)
         _cusparse.gather(handle, desc_y.desc, desc_x.desc)
+    x.data = data_sorted
 
 
 def cscsort(x):
@@ -886,21 +889,23 @@ def cscsort(x):
         x.indices.data.ptr)
     buf = _cupy.empty(buffer_size, 'b')
     P = _cupy.empty(nnz, 'i')
-    data_orig = x.data.copy()
     _cusparse.createIdentityPermutation(handle, nnz, P.data.ptr)
     _cusparse.xcscsort(
         handle, m, n, nnz, x._descr.descriptor, x.indptr.data.ptr,
         x.indices.data.ptr, P.data.ptr, buf.data.ptr)
 
+    # see csrsort: gather into a fresh buffer rather than copying first
+    data_sorted = _cupy.empty_like(x.data)
     if check_availability('gthr'):
         _call_cusparse(
             'gthr', x.dtype,
-            handle, nnz, data_orig.data.ptr, x.data.data.ptr,
+            handle, nnz, x.data.data.ptr, data_sorted.data.ptr,
             P.data.ptr, _cusparse.CUSPARSE_INDEX_BASE_ZERO)
     else:
-        desc_x = SpVecDescriptor.create(P, x.data)
-        desc_y = DnVecDescriptor.create(data_orig)
+        desc_x = SpVecDescriptor.create(P, data_sorted)
+        desc_y = DnVecDescriptor.create(x.data)
         _cusparse.gather(handle, desc_y.desc, desc_x.desc)
+    x.data = data_sorted
 
 
 def coosort(x, sort_by='r'):
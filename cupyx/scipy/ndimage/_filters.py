@@ -1,3 +1,6 @@
+import functools
+import math
+
 import numpy
 
 import cupy
@@ -765,9 +768,15 @@ def maximum_filter(input, size=None, footprint=None, output=None,
 
 
 def _min_or_max_filter(input, size, ftprnt, structure, output, mode, cval,
-                       origin, func):
+                       origin, func, anchor=None, anchor_op=None,
+                       flip_weights=False):
     # structure is used by morphology.grey_erosion() and grey_dilation()
     # and not by the regular min/max filters
+    # anchor/anchor_op are used by morphology.white_tophat() and
+    # black_tophat() to fold the final combination with the original input
+    # into the second filter pass
+    # flip_weights mirrors the footprint/structure at kernel-generation time
+    # (grey_dilation), avoiding a reversed copy of both arrays per call
 
     if isinstance(ftprnt, tuple) and size is None:
         size = ftprnt
@@ -778,7 +787,21 @@ def _min_or_max_filter(input, size, ftprnt, structure, output, mode, cval,
     if cval is cupy.nan:
         raise NotImplementedError("NaN cval is unsupported")
 
+    if structure is not None and not structure.any():  # synchronize!
+        # An all-zero (flat) structuring element adds nothing to the window
+        # values, so it reduces to a plain min/max filter. Dropping it here
+        # unlocks the all-ones separable path below: an N-D box becomes N
+        # 1-D passes with O(N*k) instead of O(k^N) reads per pixel.
+        structure = None
+        if sizes is None and ftprnt.ndim == input.ndim and bool(ftprnt.all()):
+            sizes = ftprnt.shape
+            ftprnt = None
+
     if sizes is not None:
+        if anchor is not None:
+            # the separable path has no epilogue to fuse into; the caller
+            # falls back to combining with a separate elementwise op
+            return None
         # Separable filter, run as a series of 1D filters
         fltr = minimum_filter1d if func == 'min' else maximum_filter1d
         return _filters_core._run_1d_filters(
@@ -794,12 +817,52 @@ def _min_or_max_filter(input, size, ftprnt, structure, output, mode, cval,
     if ftprnt.size == 0:
         return cupy.zeros_like(input)
     offsets = _filters_core._origins_to_offsets(origins, ftprnt.shape)
+    if structure is None and anchor is None and ftprnt.size <= 27:
+        # small footprints (default boxes and connectivity crosses): bake
+        # the positions into a fully unrolled kernel
+        ftprnt_cpu = cupy.asnumpy(ftprnt)  # small; synchronizes
+        if flip_weights:
+            flip = (slice(None, None, -1),) * ftprnt_cpu.ndim
+            ftprnt_cpu = numpy.ascontiguousarray(ftprnt_cpu[flip])
+        positions, _ = _footprint_host_info(ftprnt_cpu.tobytes(),
+                                            ftprnt_cpu.shape)
+        kernel = _get_min_or_max_unrolled_kernel(
+            positions, ftprnt.shape, mode, func, offsets, float(cval),
+            int_type)
+        return _filters_core._call_kernel(kernel, input, None, output,
+                                          weights_dtype=bool)
+    if structure is None and anchor is None and input.ndim == 2:
+        out = _min_or_max_tiled_2d(input, ftprnt, output, mode, cval, offsets,
+                                   func, flip_weights)
+        if out is not None:
+            return out
+    if bool(ftprnt.all()):  # synchronize! (footprints are small)
+        # all-ones footprint: emit a kernel without the weight loads and
+        # nonzero guards and do not pass the footprint array at all
+        kernel = _get_min_or_max_kernel(mode, ftprnt.shape, func,
+                                        offsets, float(cval), int_type,
+                                        has_weights=False,
+                                        has_structure=structure is not None,
+                                        anchor_op=anchor_op,
+                                        flip_weights=flip_weights, flat=True)
+        return _filters_core._call_kernel(kernel, input, None, output,
+                                          structure, weights_dtype=bool,
+                                          anchor=anchor)
+    if flip_weights:
+        # the kernel walks the weights backward; the window position aligned
+        # with the output pixel then maps to the mirrored footprint element
+        center = tuple(s - 1 - o for s, o in zip(ftprnt.shape, offsets))
+    else:
+        center = offsets
     kernel = _get_min_or_max_kernel(mode, ftprnt.shape, func,
                                     offsets, float(cval), int_type,
                                     has_structure=structure is not None,
-                                    has_central_value=bool(ftprnt[offsets]))
+                                    has_central_value=bool(ftprnt[center]),
+                                    anchor_op=anchor_op,
+                                    flip_weights=flip_weights)
     return _filters_core._call_kernel(kernel, input, ftprnt, output,
-                                      structure, weights_dtype=bool)
+                                      structure, weights_dtype=bool,
+                                      anchor=anchor)
 
 
 def minimum_filter1d(input, size, axis=-1, output=None, mode="reflect",
@@ -856,8 +919,240 @@ def maximum_filter1d(input, size, axis=-1, output=None, mode="reflect",
     return _min_or_max_1d(input, size, axis, output, mode, cval, origin, 'max')
 
 
+@functools.lru_cache(maxsize=256)
+def _footprint_host_info(key, shape):
+    # Host-side analysis of a (small) boolean footprint, keyed by its bytes:
+    # compositions such as opening, closing, tophat and gradient launch two
+    # passes with the same element, so the nonzero scan and symmetry test
+    # only need to run once per distinct footprint.
+    fp = numpy.frombuffer(key, dtype=bool).reshape(shape)
+    positions = tuple(map(tuple, numpy.argwhere(fp).tolist()))
+    flip = (slice(None, None, -1),) * fp.ndim
+    symmetric = bool((fp == fp[flip]).all())
+    return positions, symmetric
+
+
+_MINMAX_TILE = 16
+
+
+@cupy._util.memoize(for_each_device=True)
+def _get_min_or_max_tiled_kernel(func, mode, ctype, rel, ry, rx, has_center):
+    # Shared-memory tiled 2-D min/max: the block cooperatively loads one
+    # (TILE+2*ry) x (TILE+2*rx) halo tile once, then every thread scans its
+    # footprint from shared memory, so each input pixel is read from DRAM
+    # about once instead of once per footprint element. The footprint
+    # positions are baked into the source (the kernel is memoized on them).
+    cmp = '<' if func == 'min' else '>'
+    tile = _MINMAX_TILE
+    boundary_y = _util._generate_boundary_condition_ops(
+        mode, 'iy', 'H', 'long long')
+    boundary_x = _util._generate_boundary_condition_ops(
+        mode, 'ix', 'W', 'long long')
+    smem_w = tile + 2 * rx
+    smem_h = tile + 2 * ry
+    center = f'{ry * smem_w + rx}'
+    if has_center:
+        init = f'{ctype} value = smem[soff + {center}];'
+        updates = []
+    else:
+        init = f'{ctype} value = smem[soff + {rel[0][0] * smem_w + rel[0][1]}];'
+        rel = rel[1:]
+        updates = []
+    for dy, dx in rel:
+        updates.append(
+            f'{{ {ctype} v = smem[soff + {dy * smem_w + dx}]; '
+            f'if (v {cmp} value) value = v; }}')
+    updates = '\n    '.join(updates)
+    return cupy.RawKernel(f'''
+extern "C" __global__ void minmax_tiled_{func}(
+    const {ctype}* x, {ctype}* y, long long H, long long W, double cval)
+{{
+    __shared__ {ctype} smem[{smem_h * smem_w}];
+    long long bx = (long long)blockIdx.x * {tile};
+    long long by = (long long)blockIdx.y * {tile};
+    for (int idx = threadIdx.y * {tile} + threadIdx.x;
+            idx < {smem_h * smem_w}; idx += {tile * tile}) {{
+        int ly = idx / {smem_w};
+        int lx = idx - ly * {smem_w};
+        long long iy = by + ly - {ry};
+        long long ix = bx + lx - {rx};
+        {boundary_y}
+        {boundary_x}
+        smem[idx] = (iy < 0 || ix < 0) ? ({ctype})cval : x[iy * W + ix];
+    }}
+    __syncthreads();
+    long long oy = by + threadIdx.y;
+    long long ox = bx + threadIdx.x;
+    if (oy >= H || ox >= W) return;
+    int soff = (threadIdx.y + {ry}) * {smem_w} + threadIdx.x + {rx};
+    {init}
+    {updates}
+    y[oy * W + ox] = value;
+}}''', f'minmax_tiled_{func}')
+
+
+def _min_or_max_tiled_2d(input, ftprnt, output, mode, cval, offsets, func,
+                         flip_weights=False):
+    # Returns None when the tiled kernel does not apply and the generic
+    # elementwise kernel must be used instead.
+    h, w = ftprnt.shape
+    ry, rx = h // 2, w // 2
+    if (h % 2 == 0 or w % 2 == 0 or offsets != (ry, rx)
+            or max(ry, rx) > 7):
+        return None
+    if input.dtype.char not in _VHGW_CTYPES or not input.flags.c_contiguous:
+        return None
+    if isinstance(output, cupy.ndarray):
+        if output.dtype != input.dtype or not output.flags.c_contiguous:
+            return None
+    ftprnt_cpu = cupy.asnumpy(ftprnt)  # small; synchronizes
+    if flip_weights:
+        ftprnt_cpu = numpy.ascontiguousarray(ftprnt_cpu[::-1, ::-1])
+    positions, _ = _footprint_host_info(ftprnt_cpu.tobytes(),
+                                        ftprnt_cpu.shape)
+    if len(positions) < 16:
+        # sparse footprints fare better in the generic kernel
+        return None
+    has_center = bool(ftprnt_cpu[ry, rx])
+    rel = []
+    for py, px in positions:
+        if has_center and (py, px) == (ry, rx):
+            continue
+        rel.append((py - ry, px - rx))
+    output = _util._get_output(output, input)
+    if output.dtype != input.dtype:
+        return None
+    needs_temp = cupy.shares_memory(output, input, 'MAY_SHARE_BOUNDS')
+    if needs_temp:
+        output, temp = _util._get_output(output.dtype, input), output
+    mode = 'grid-wrap' if mode == 'wrap' else mode
+    kernel = _get_min_or_max_tiled_kernel(
+        func, mode, _VHGW_CTYPES[input.dtype.char], tuple(rel), ry, rx,
+        has_center)
+    hh, ww = input.shape
+    tile = _MINMAX_TILE
+    kernel((-(-ww // tile), -(-hh // tile)), (tile, tile),
+           (input, output, numpy.int64(hh), numpy.int64(ww),
+            numpy.float64(cval)))
+    if needs_temp:
+        _core.elementwise_copy(output, temp)
+        output = temp
+    return output
+
+
+_VHGW_CTYPES = {
+    '?': 'unsigned char', 'b': 'signed char', 'B': 'unsigned char',
+    'h': 'short', 'H': 'unsigned short', 'i': 'int', 'I': 'unsigned int',
+    'l': 'long long', 'L': 'unsigned long long',
+    'q': 'long long', 'Q': 'unsigned long long',
+    'f': 'float', 'd': 'double',
+}
+
+
+@cupy._util.memoize(for_each_device=True)
+def _get_vhgw_kernel(func, mode, ctype):
+    # van Herk/Gil-Werman 1-D min/max: each thread emits one k-aligned block
+    # of outputs per line from the suffix scan of one input block combined
+    # with a running prefix scan of the next, ~3 comparisons per output
+    # independent of k. Intermediate values are doubles for consistency with
+    # the sliding-window kernel (and scipy).
+    op = 'fmin' if func == 'min' else 'fmax'
+    boundary = _util._generate_boundary_condition_ops(
+        mode, 'ix', 'n', 'long long')
+    fetch_oob = 'if (ix < 0) return cval;' if mode == 'constant' else ''
+    return cupy.RawKernel(f'''
+extern "C" {{
+
+__device__ double vhgw_read(
+    const {ctype}* x, long long ix, long long n,
+    long long base, long long stride, double cval)
+{{
+    {boundary}
+    {fetch_oob}
+    return (double)x[base + ix * stride];
+}}
+
+__global__ void vhgw_{func}(
+    const {ctype}* x, {ctype}* y,
+    long long n_lines, long long n, long long stride,
+    long long k, long long anchor, double cval)
+{{
+    long long nseg = (n + k - 1) / k;
+    long long t = (long long)blockIdx.x * blockDim.x + threadIdx.x;
+    if (t >= n_lines * nseg) return;
+    long long line = t / nseg;
+    long long seg = t - line * nseg;
+    long long base = (line / stride) * (stride * n) + (line % stride);
+    long long b = seg * k;     // first output index of this segment
+    long long p = b - anchor;  // input start of the first window
+    // suffix scan over the first input block, stored directly
+    double acc = vhgw_read(x, p + k - 1, n, base, stride, cval);
+    for (long long d = k - 1; d >= 0; d--) {{
+        if (d < k - 1) {{
+            acc = {op}(acc, vhgw_read(x, p + d, n, base, stride, cval));
+        }}
+        if (b + d < n) {{
+            y[base + (b + d) * stride] = ({ctype})acc;
+        }}
+    }}
+    // prefix scan over the second block, combined with the stored suffixes
+    acc = vhgw_read(x, p + k - 1, n, base, stride, cval);
+    for (long long d = 0; d < k; d++) {{
+        acc = {op}(acc, vhgw_read(x, p + k - 1 + d, n, base, stride, cval));
+        if (b + d < n) {{
+            double v = (double)y[base + (b + d) * stride];
+            y[base + (b + d) * stride] = ({ctype}){op}(v, acc);
+        }}
+    }}
+}}
+
+}}''', f'vhgw_{func}')
+
+
+def _min_or_max_1d_large(input, size, axis, output, mode, cval, origin, func):
+    # O(1)-per-pixel path for long flat 1-D windows; returns None when it
+    # does not apply and the sliding-window kernel must be used instead.
+    if input.size == 0 or input.dtype.char not in _VHGW_CTYPES:
+        return None
+    if isinstance(output, cupy.ndarray):
+        if output.dtype != input.dtype or not output.flags.c_contiguous:
+            return None
+    _util._check_mode(mode)
+    # for filters, "wrap" is a synonym for "grid-wrap"
+    mode = 'grid-wrap' if mode == 'wrap' else mode
+    axis = internal._normalize_axis_index(axis, input.ndim)
+    _util._check_origin(origin, size)
+    input = cupy.ascontiguousarray(input)
+    output = _util._get_output(output, input)
+    if output.dtype != input.dtype:
+        return None
+    needs_temp = cupy.shares_memory(output, input, 'MAY_SHARE_BOUNDS')
+    if needs_temp:
+        output, temp = _util._get_output(output.dtype, input), output
+    n = input.shape[axis]
+    stride = math.prod(input.shape[axis + 1:])
+    n_lines = input.size // n
+    n_seg = -(-n // size)
+    kernel = _get_vhgw_kernel(func, mode, _VHGW_CTYPES[input.dtype.char])
+    total = n_lines * n_seg
+    block = 256
+    kernel(((total + block - 1) // block,), (block,),
+           (input, output, numpy.int64(n_lines), numpy.int64(n),
+            numpy.int64(stride), numpy.int64(size),
+            numpy.int64(size // 2 + origin), numpy.float64(cval)))
+    if needs_temp:
+        _core.elementwise_copy(output, temp)
+        output = temp
+    return output
+
+
 def _min_or_max_1d(input, size, axis=-1, output=None, mode="reflect", cval=0.0,
                    origin=0, func='min'):
+    if size >= 16:
+        out = _min_or_max_1d_large(input, size, axis, output, mode, cval,
+                                   origin, func)
+        if out is not None:
+            return out
     ftprnt = cupy.ones(size, dtype=bool)
     ftprnt, origin = _filters_core._convert_1d_args(input.ndim, ftprnt,
                                                     origin, axis)
@@ -870,16 +1165,81 @@ def _min_or_max_1d(input, size, axis=-1, output=None, mode="reflect", cval=0.0,
                                       weights_dtype=bool)
 
 
+@cupy._util.memoize(for_each_device=True)
+def _get_min_or_max_unrolled_kernel(positions, w_shape, mode, func, offsets,
+                                    cval, int_type):
+    # Specialization for small footprints (default 3x3 boxes, connectivity
+    # crosses, ...): the footprint positions are baked into the source as one
+    # hard-coded block per element, removing the bounding-box loop, weight
+    # fetches and per-step bounds arithmetic.
+    ndim = len(w_shape)
+    mode = 'grid-wrap' if mode == 'wrap' else mode
+    size = ('%s xsize_{j}=x.shape()[{j}], ysize_{j} = _raw_y.shape()[{j}]'
+            ', xstride_{j}=x.strides()[{j}];' % int_type)
+    sizes = [size.format(j=j) for j in range(ndim)]
+    inds = _util._generate_indices_ops(ndim, int_type, offsets)
+
+    blocks = []
+    for k, pos in enumerate(positions):
+        coords = []
+        for j in range(ndim):
+            coords.append(f'{int_type} ix_{j} = ind_{j} + {pos[j]};')
+            if mode != 'constant':
+                coords.append(_util._generate_boundary_condition_ops(
+                    mode, f'ix_{j}', f'xsize_{j}', int_type))
+        coords = '\n'.join(coords)
+        expr = ' + '.join(f'ix_{j} * xstride_{j}' for j in range(ndim))
+        if mode == 'constant':
+            cond = ' || '.join(
+                f'(ix_{j} < 0) || (ix_{j} >= xsize_{j})'
+                for j in range(ndim))
+            fetch = (f'X v = ({cond}) ? cast<X>({cval}) : '
+                     f'(*(X*)&data[{expr}]);')
+        else:
+            fetch = f'X v = (*(X*)&data[{expr}]);'
+        update = ('value = v;' if k == 0
+                  else f'value = {func}(v, value);')
+        blocks.append(f'''
+    {{
+        {coords}
+        {fetch}
+        {update}
+    }}''')
+
+    operation = '''
+    {sizes}
+    {inds}
+    const unsigned char* data = (const unsigned char*)&x[0];
+    X value;
+    {blocks}
+    y = cast<Y>(value);
+    '''.format(sizes='\n'.join(sizes), inds=inds, blocks='\n'.join(blocks))
+
+    mode_str = mode.replace('-', '_')
+    name = 'cupyx_scipy_ndimage_{}_unrolled_{}d_{}_n{}'.format(
+        func, ndim, mode_str, len(positions))
+    if int_type == 'ptrdiff_t':
+        name += '_i64'
+    preamble = _filters_core.includes + _filters_core._CAST_FUNCTION
+    return cupy.ElementwiseKernel(
+        'raw X x', 'Y y', operation, name, reduce_dims=False,
+        preamble=preamble, options=('--std=c++11', '-DCUPY_USE_JITIFY'))
+
+
 @cupy._util.memoize(for_each_device=True)
 def _get_min_or_max_kernel(mode, w_shape, func, offsets, cval, int_type,
                            has_weights=True, has_structure=False,
-                           has_central_value=True):
+                           has_central_value=True, anchor_op=None,
+                           flip_weights=False, flat=False):
     # When there are no 'weights' (the footprint, for the 1D variants) then
     # we need to make sure intermediate results are stored as doubles for
-    # consistent results with scipy.
-    ctype = 'X' if has_weights else 'double'
+    # consistent results with scipy. 'flat' marks an all-ones footprint that
+    # is skipped entirely (no weight array is passed); unlike the 1D variants
+    # it keeps intermediates in the input type, matching the footprint kernel
+    # it replaces.
+    ctype = 'X' if (has_weights or flat) else 'double'
     value = '{value}'
-    if not has_weights:
+    if not (has_weights or flat):
         value = 'cast<double>({})'.format(value)
 
     # Having a non-flat structure biases the values
@@ -896,11 +1256,247 @@ def _get_min_or_max_kernel(mode, w_shape, func, offsets, cval, int_type,
         pre = '{} value; bool set = false;'
         found = 'value = set ? {func}({value}, value) : {value}; set=true;'
 
+    if anchor_op is None:
+        post = 'y = cast<Y>(value);'
+    elif anchor_op == 'sub_from':
+        post = 'y = cast<Y>(anchor[i] - value);'
+    elif anchor_op == 'sub':
+        post = 'y = cast<Y>(value - anchor[i]);'
+    else:  # 'xor'
+        post = 'y = cast<Y>((bool)anchor[i] != (bool)value);'
+
+    name = func if anchor_op is None else f'{func}_{anchor_op}'
     return _filters_core._generate_nd_kernel(
-        func, pre.format(ctype),
-        found.format(func=func, value=value), 'y = cast<Y>(value);',
+        name, pre.format(ctype),
+        found.format(func=func, value=value), post,
         mode, w_shape, int_type, offsets, cval, ctype=ctype,
-        has_weights=has_weights, has_structure=has_structure)
+        has_weights=has_weights, has_structure=has_structure,
+        has_anchor=anchor_op is not None, flip_weights=flip_weights)
+
+
+@cupy._util.memoize(for_each_device=True)
+def _get_grey_open_close_kernel(rel, ndim, mode, op, cval, int_type):
+    # Composite opening/closing in one pass: for a symmetric flat element S,
+    # opening[i] = max_{s in S} min_{t in S} x[i+s+t] (min/max swapped for
+    # closing). Boundaries are resolved in two steps, first on i+s and then
+    # on (i+s)+t, reproducing what the two-pass version does to its
+    # intermediate array.
+    outer, inner = ('max', 'min') if op == 'open' else ('min', 'max')
+    size = ('%s xsize_{j}=x.shape()[{j}], ysize_{j} = _raw_y.shape()[{j}]'
+            ', xstride_{j}=x.strides()[{j}];' % int_type)
+    sizes = [size.format(j=j) for j in range(ndim)]
+    inds = _util._generate_indices_ops(ndim, int_type, (0,) * ndim)
+
+    def read_block(prefix, rt, ti):
+        # index arithmetic + fetch for the inner stage at offset rt
+        lines = []
+        for j in range(ndim):
+            lines.append(f'{int_type} jx_{j} = {prefix}_{j} + {rt[j]};')
+            if mode != 'constant':
+                lines.append(_util._generate_boundary_condition_ops(
+                    mode, f'jx_{j}', f'xsize_{j}', int_type))
+        expr = ' + '.join(f'jx_{j} * xstride_{j}' for j in range(ndim))
+        if mode == 'constant':
+            cond = ' || '.join(
+                f'(jx_{j} < 0) || (jx_{j} >= xsize_{j})'
+                for j in range(ndim))
+            fetch = (f'X v = ({cond}) ? cast<X>({cval}) : '
+                     f'(*(X*)&data[{expr}]);')
+        else:
+            fetch = f'X v = (*(X*)&data[{expr}]);'
+        update = 'mn = v;' if ti == 0 else f'mn = {inner}(v, mn);'
+        body = '\n            '.join(lines + [fetch, update])
+        return f'''
+        {{
+            {body}
+        }}'''
+
+    outer_blocks = []
+    for si, rs in enumerate(rel):
+        coords = []
+        for j in range(ndim):
+            coords.append(f'{int_type} ix_{j} = ind_{j} + {rs[j]};')
+            if mode != 'constant':
+                coords.append(_util._generate_boundary_condition_ops(
+                    mode, f'ix_{j}', f'xsize_{j}', int_type))
+        coords = '\n        '.join(coords)
+        inner_blocks = ''.join(
+            read_block('ix', rt, ti) for ti, rt in enumerate(rel))
+        update = 'value = mn;' if si == 0 else f'value = {outer}(mn, value);'
+        if mode == 'constant':
+            cond = ' || '.join(
+                f'(ix_{j} < 0) || (ix_{j} >= xsize_{j})'
+                for j in range(ndim))
+            # an out-of-bounds intermediate position holds cval, exactly as
+            # the second pass of the two-pass version would read it
+            body = f'''
+        X mn;
+        if ({cond}) {{
+            mn = cast<X>({cval});
+        }} else {{
+            {inner_blocks}
+        }}
+        {update}'''
+        else:
+            body = f'''
+        X mn;
+        {inner_blocks}
+        {update}'''
+        outer_blocks.append(f'''
+    {{
+        {coords}
+        {body}
+    }}''')
+
+    operation = '''
+    {sizes}
+    {inds}
+    const unsigned char* data = (const unsigned char*)&x[0];
+    X value;
+    {blocks}
+    y = cast<Y>(value);
+    '''.format(sizes='\n'.join(sizes), inds=inds,
+               blocks='\n'.join(outer_blocks))
+
+    mode_str = mode.replace('-', '_')
+    name = 'cupyx_scipy_ndimage_grey_{}_fused_{}d_{}_n{}'.format(
+        op, ndim, mode_str, len(rel))
+    if int_type == 'ptrdiff_t':
+        name += '_i64'
+    preamble = _filters_core.includes + _filters_core._CAST_FUNCTION
+    return cupy.ElementwiseKernel(
+        'raw X x', 'Y y', operation, name, reduce_dims=False,
+        preamble=preamble, options=('--std=c++11', '-DCUPY_USE_JITIFY'))
+
+
+def _grey_open_close_fused(input, size, ftprnt, structure, output, mode, cval,
+                           origin, op):
+    # Single-kernel grey_opening/grey_closing used for small centered
+    # symmetric flat elements; returns None when the two-pass composition
+    # must be used instead.
+    if isinstance(origin, (list, tuple)):
+        if any(o != 0 for o in origin):
+            return None
+    elif origin != 0:
+        return None
+    if size is not None and (ftprnt is not None or structure is not None):
+        return None
+    if cval is cupy.nan:
+        raise NotImplementedError("NaN cval is unsupported")
+    _util._check_mode(mode)
+    if isinstance(ftprnt, tuple) and size is None:
+        size = ftprnt
+        ftprnt = None
+    sizes, ftprnt, structure = _filters_core._check_size_footprint_structure(
+        input.ndim, size, ftprnt, structure, force_footprint=True)
+    if structure is not None:
+        if structure.any():  # synchronize!
+            # a non-flat structure enters the values twice with opposite
+            # signs; keep the two-pass version for that case
+            return None
+        structure = None
+    if ftprnt.size == 0 or any(s % 2 == 0 for s in ftprnt.shape):
+        return None
+    ftprnt_cpu = cupy.asnumpy(ftprnt)  # small; synchronizes
+    positions, symmetric = _footprint_host_info(ftprnt_cpu.tobytes(),
+                                                ftprnt_cpu.shape)
+    if not symmetric or len(positions) > 9:
+        return None
+    center = tuple(s // 2 for s in ftprnt.shape)
+    rel = tuple(
+        tuple(p - c for p, c in zip(pos, center)) for pos in positions)
+    mode2 = 'grid-wrap' if mode == 'wrap' else mode
+    kernel = _get_grey_open_close_kernel(
+        rel, input.ndim, mode2, op, float(cval),
+        _util._get_inttype(input))
+    return _filters_core._call_kernel(kernel, input, None, output,
+                                      weights_dtype=bool)
+
+
+def _min_and_max_filter(input, size, ftprnt, structure, output, mode, cval,
+                        origin, combine):
+    # Single-pass min+max used by morphology.morphological_gradient() and
+    # morphological_laplace(): both need the erosion and the dilation of the
+    # same input, so computing them in one kernel halves the window reads and
+    # skips the intermediate array. Returns None when the fused kernel does
+    # not apply (shifted origin, even or asymmetric footprint, large box) and
+    # the caller must fall back to separate erosion/dilation passes.
+    if isinstance(origin, (list, tuple)):
+        if any(o != 0 for o in origin):
+            return None
+    elif origin != 0:
+        return None
+    if size is not None and (ftprnt is not None or structure is not None):
+        # let the fallback path emit the "ignoring size" warning once
+        return None
+    if cval is cupy.nan:
+        raise NotImplementedError("NaN cval is unsupported")
+    if isinstance(ftprnt, tuple) and size is None:
+        size = ftprnt
+        ftprnt = None
+    sizes, ftprnt, structure = _filters_core._check_size_footprint_structure(
+        input.ndim, size, ftprnt, structure, force_footprint=True)
+    if ftprnt.size == 0:
+        return None
+    if any(s % 2 == 0 for s in ftprnt.shape) or ftprnt.size > 64:
+        # even sizes shift the dilation origin relative to the erosion; big
+        # all-ones boxes are faster as separable 1-D passes
+        return None
+    # grey_dilation uses the flipped structuring element, so a single window
+    # scan is only exact when footprint and structure are symmetric
+    flip = tuple([slice(None, None, -1)] * input.ndim)
+    ftprnt_cpu = cupy.asnumpy(ftprnt)
+    _, symmetric = _footprint_host_info(ftprnt_cpu.tobytes(),
+                                        ftprnt_cpu.shape)
+    if not symmetric:
+        return None
+    if structure is not None:
+        structure_cpu = cupy.asnumpy(structure)
+        if not (structure_cpu == structure_cpu[flip]).all():
+            return None
+    origins, int_type = _filters_core._check_nd_args(input, ftprnt, mode,
+                                                     origin, 'footprint')
+    offsets = _filters_core._origins_to_offsets(origins, ftprnt.shape)
+    kernel = _get_min_and_max_kernel(mode, ftprnt.shape, combine,
+                                     offsets, float(cval), int_type,
+                                     has_structure=structure is not None,
+                                     has_central_value=bool(
+                                         ftprnt_cpu[offsets]))
+    return _filters_core._call_kernel(kernel, input, ftprnt, output,
+                                      structure, weights_dtype=bool)
+
+
+@cupy._util.memoize(for_each_device=True)
+def _get_min_and_max_kernel(mode, w_shape, combine, offsets, cval, int_type,
+                            has_structure=False, has_central_value=True):
+    # Maintains both accumulators over one footprint scan and combines them
+    # on the final store: 'gradient' is mx - mn, 'laplace' is mx + mn - 2*x.
+    base = '{value}'
+    if has_structure:
+        vmax = f'({base}+cast<X>(sval))'
+        vmin = f'({base}-cast<X>(sval))'
+    else:
+        vmax = vmin = base
+
+    if has_central_value:
+        pre = 'X mn = x[i]; X mx = mn;'
+        found = (f'mx = max(cast<X>({vmax}), mx); '
+                 f'mn = min(cast<X>({vmin}), mn);')
+    else:
+        pre = 'X mn; X mx; bool set = false;'
+        found = (f'mx = set ? max(cast<X>({vmax}), mx) : cast<X>({vmax}); '
+                 f'mn = set ? min(cast<X>({vmin}), mn) : cast<X>({vmin}); '
+                 'set = true;')
+
+    if combine == 'gradient':
+        post = 'y = cast<Y>(mx - mn);'
+    else:  # 'laplace'
+        post = 'y = cast<Y>(mx + mn - 2 * x[i]);'
+
+    return _filters_core._generate_nd_kernel(
+        f'min_and_max_{combine}', pre, found, post,
+        mode, w_shape, int_type, offsets, cval,
+        has_weights=True, has_structure=has_structure)
 
 
 def rank_filter(input, rank, size=None, footprint=None, output=None,
@@ -13,6 +13,26 @@ def _origins_to_offsets(origins, w_shape):
     return tuple(x//2+o for x, o in zip(w_shape, origins))
 
 
+@cupy.memoize(for_each_device=True)
+def _upload_footprint(data, shape, dtype):
+    # Cache the device copies of small host-side footprints/structures.
+    # Compositions such as opening, closing, the tophats and the gradient
+    # re-upload the same tiny array two or more times per call otherwise.
+    # Keyed per device so a cache hit never hands out an array that lives
+    # on another GPU.
+    return cupy.asarray(numpy.frombuffer(data, dtype=dtype).reshape(shape))
+
+
+def _asarray_cached(a, dtype=None):
+    """Like cupy.ascontiguousarray but memoizes small host→device uploads."""
+    if isinstance(a, cupy.ndarray):
+        return cupy.ascontiguousarray(a, dtype)
+    a = numpy.ascontiguousarray(a, dtype)
+    if a.nbytes <= 4096:
+        return _upload_footprint(a.tobytes(), a.shape, a.dtype.str)
+    return cupy.asarray(a)
+
+
 def _check_size_footprint_structure(ndim, size, footprint, structure,
                                     stacklevel=3, force_footprint=False):
     if structure is None and footprint is None:
@@ -28,7 +48,7 @@ def _check_size_footprint_structure(ndim, size, footprint, structure,
             UserWarning, stacklevel=stacklevel+1)
 
     if footprint is not None:
-        footprint = cupy.array(footprint, bool, True, 'C')
+        footprint = _asarray_cached(footprint, bool)
         if not footprint.any():
             raise ValueError("all-zero footprint is not supported")
 
@@ -39,7 +59,7 @@ def _check_size_footprint_structure(ndim, size, footprint, structure,
             return footprint.shape, None, None
         return None, footprint, None
 
-    structure = cupy.ascontiguousarray(structure)
+    structure = _asarray_cached(structure)
     if footprint is None:
         footprint = cupy.ones(structure.shape, bool)
     return None, footprint, structure
@@ -120,7 +140,8 @@ def _run_1d_filters(filters, input, args, output, mode, cval, origin=0):
 
 
 def _call_kernel(kernel, input, weights, output, structure=None,
-                 weights_dtype=numpy.float64, structure_dtype=numpy.float64):
+                 weights_dtype=numpy.float64, structure_dtype=numpy.float64,
+                 anchor=None):
     """
     Calls a constructed ElementwiseKernel. The kernel must take an input image,
     an optional array of weights, an optional array for the structure, and an
@@ -149,6 +170,8 @@ def _call_kernel(kernel, input, weights, output, structure=None,
     if structure is not None:
         structure = cupy.ascontiguousarray(structure, structure_dtype)
         args.append(structure)
+    if anchor is not None:
+        args.append(anchor)
     output = _util._get_output(output, input, None, complex_output)
     needs_temp = cupy.shares_memory(output, input, 'MAY_SHARE_BOUNDS')
     if needs_temp:
@@ -199,6 +222,7 @@ __device__ __forceinline__ bool nonzero(T x) { return x != static_cast<T>(0); }
 def _generate_nd_kernel(name, pre, found, post, mode, w_shape, int_type,
                         offsets, cval, ctype='X', preamble='', options=(),
                         has_weights=True, has_structure=False, has_mask=False,
+                        has_anchor=False, flip_weights=False,
                         binary_morphology=False, all_weights_nonzero=False):
     # Currently this code uses CArray for weights but avoids using CArray for
     # the input data and instead does the indexing itself since it is faster.
@@ -213,6 +237,8 @@ def _generate_nd_kernel(name, pre, found, post, mode, w_shape, int_type,
         in_params += ', raw S s'
     if has_mask:
         in_params += ', raw M mask'
+    if has_anchor:
+        in_params += ', raw A anchor'
     out_params = 'Y y'
 
     # for filters, "wrap" is a synonym for "grid-wrap"
@@ -228,14 +254,24 @@ def _generate_nd_kernel(name, pre, found, post, mode, w_shape, int_type,
 
     ws_init = ws_pre = ws_post = ''
     if has_weights or has_structure:
-        ws_init = 'int iws = 0;'
+        if flip_weights:
+            # walking the weights backward is equivalent to mirroring the
+            # footprint/structure along every axis without copying it
+            # (used by grey_dilation)
+            w_size = 1
+            for x in w_shape:
+                w_size *= x
+            ws_init = f'int iws = {w_size - 1};'
+            ws_post = 'iws--;'
+        else:
+            ws_init = 'int iws = 0;'
+            ws_post = 'iws++;'
         if has_structure:
             ws_pre = 'S sval = s[iws];\n'
         if has_weights:
             ws_pre += 'W wval = w[iws];\n'
             if not all_weights_nonzero:
                 ws_pre += 'if (nonzero(wval))'
-        ws_post = 'iws++;'
 
     loops = []
     for j in range(ndim):
@@ -306,6 +342,10 @@ def _generate_nd_kernel(name, pre, found, post, mode, w_shape, int_type,
         name += '_with_structure'
     if has_mask:
         name += '_with_mask'
+    if has_anchor:
+        name += '_with_anchor'
+    if flip_weights:
+        name += '_flipped'
     preamble = includes + _CAST_FUNCTION + preamble
     options += ('--std=c++11', '-DCUPY_USE_JITIFY')
     return cupy.ElementwiseKernel(in_params, out_params, operation, name,
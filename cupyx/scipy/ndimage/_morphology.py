@@ -1,3 +1,5 @@
+import functools
+import itertools
 import math
 import operator
 import warnings
@@ -10,6 +12,7 @@ from cupy import _core
 from cupyx.scipy.ndimage import _filters_core
 from cupyx.scipy.ndimage import _util
 from cupyx.scipy.ndimage import _filters
+from cupyx.scipy.ndimage import _measurements
 
 
 @cupy.memoize(for_each_device=True)
@@ -26,6 +29,10 @@ def _get_binary_erosion_kernel(
         true_val = 1
         false_val = 0
 
+    center_test = f"""_in == {false_val}) {{
+                y = cast<Y>(_in);
+                return;
+            }}"""
     if masked:
         pre = f"""
             bool mv = (bool)mask[i];
@@ -33,27 +40,37 @@ def _get_binary_erosion_kernel(
             if (!mv) {{
                 y = cast<Y>(_in);
                 return;
-            }} else if ({int(center_is_true)} && _in == {false_val}) {{
-                y = cast<Y>(_in);
-                return;
             }}"""
+        if center_is_true:
+            pre += f""" else if ({center_test}"""
     else:
-        pre = f"""
-            bool _in = (bool)x[i];
-            if ({int(center_is_true)} && _in == {false_val}) {{
-                y = cast<Y>(_in);
-                return;
-            }}"""
+        pre = """
+            bool _in = (bool)x[i];"""
+        if center_is_true:
+            pre += f"""
+            if ({center_test}"""
     pre = pre + f"""
             y = cast<Y>({true_val});"""
 
     # {{{{ required because format is called again within _generate_nd_kernel
-    found = f"""
-        if ({{cond}}) {{{{
-            if (!{border_value}) {{{{
+    # The kernel is memoized on border_value, so specialize the boundary
+    # handling at generation time instead of testing a constant on the device:
+    # a false border fails the erosion outright while a true border never
+    # affects the result (the out-of-bounds read must still be guarded).
+    if border_value:
+        found = f"""
+        if (!({{cond}})) {{{{
+            bool nn = {{value}} ? {true_val} : {false_val};
+            if (!nn) {{{{
                 y = cast<Y>({false_val});
                 return;
             }}}}
+        }}}}"""
+    else:
+        found = f"""
+        if ({{cond}}) {{{{
+            y = cast<Y>({false_val});
+            return;
         }}}} else {{{{
             bool nn = {{value}} ? {true_val} : {false_val};
             if (!nn) {{{{
@@ -77,9 +94,561 @@ def _get_binary_erosion_kernel(
         binary_morphology=True)
 
 
-def _center_is_true(structure, origin):
+@cupy.memoize(for_each_device=True)
+def _get_binary_erosion_unrolled_kernel(
+    positions, w_shape, int_type, offsets, center_is_true, border_value,
+    invert, masked
+):
+    # Specialization of _get_binary_erosion_kernel for sparse structures:
+    # the true structure positions are known on the host, so emit one
+    # hard-coded block per position instead of looping over the bounding box
+    # and fetching a weight per step.
+    if invert:
+        border_value = int(not border_value)
+        true_val = 0
+        false_val = 1
+    else:
+        border_value = int(border_value)
+        true_val = 1
+        false_val = 0
+
+    if masked:
+        pre = f"""
+            bool mv = (bool)mask[i];
+            bool _in = (bool)x[i];
+            if (!mv) {{
+                y = cast<Y>(_in);
+                return;
+            }} else if ({int(center_is_true)} && _in == {false_val}) {{
+                y = cast<Y>(_in);
+                return;
+            }}"""
+    else:
+        pre = f"""
+            bool _in = (bool)x[i];
+            if ({int(center_is_true)} && _in == {false_val}) {{
+                y = cast<Y>(_in);
+                return;
+            }}"""
+    pre = pre + f"""
+            y = cast<Y>({true_val});"""
+
+    ndim = len(w_shape)
+    size = ('%s xsize_{j}=x.shape()[{j}], ysize_{j} = _raw_y.shape()[{j}]'
+            ', xstride_{j}=x.strides()[{j}];' % int_type)
+    sizes = [size.format(j=j) for j in range(ndim)]
+    inds = _util._generate_indices_ops(ndim, int_type, offsets)
+
+    # Check distant neighbors first: for typical inputs the value at a far
+    # position is the most likely to differ from the center, so putting it
+    # early maximizes the chance of taking the early return above before the
+    # remaining reads are issued.
+    positions = sorted(
+        positions,
+        key=lambda pos: sum(abs(p - o) for p, o in zip(pos, offsets)),
+        reverse=True)
+
+    blocks = []
+    for pos in positions:
+        coords = '\n'.join(
+            f'{int_type} ix_{j} = ind_{j} + {pos[j]};'
+            for j in range(ndim))
+        cond = ' || '.join(
+            f'(ix_{j} < 0) || (ix_{j} >= xsize_{j})' for j in range(ndim))
+        expr = ' + '.join(f'ix_{j} * xstride_{j}' for j in range(ndim))
+        blocks.append(f'''
+    {{
+        {coords}
+        if ({cond}) {{
+            if (!{border_value}) {{
+                y = cast<Y>({false_val});
+                return;
+            }}
+        }} else {{
+            bool nn = (*(X*)&data[{expr}]) ? {true_val} : {false_val};
+            if (!nn) {{
+                y = cast<Y>({false_val});
+                return;
+            }}
+        }}
+    }}''')
+
+    operation = '''
+    {sizes}
+    {inds}
+    const unsigned char* data = (const unsigned char*)&x[0];
+    {pre}
+    {blocks}
+    '''.format(sizes='\n'.join(sizes), inds=inds, pre=pre,
+               blocks='\n'.join(blocks))
+
+    in_params = 'raw X x'
+    if masked:
+        in_params += ', raw M mask'
+    name = 'cupyx_scipy_ndimage_binary_erosion_unrolled_{}d_n{}'.format(
+        ndim, len(positions))
+    if false_val:
+        name += '_invert'
+    if int_type == 'ptrdiff_t':
+        name += '_i64'
+    if masked:
+        name += '_with_mask'
+    preamble = (_filters_core.includes + _filters_core._CAST_FUNCTION)
+    return cupy.ElementwiseKernel(
+        in_params, 'Y y', operation, name, reduce_dims=False,
+        preamble=preamble, options=('--std=c++11', '-DCUPY_USE_JITIFY'))
+
+
+_pack_bits_u64 = _core.ElementwiseKernel(
+    'raw X x, int32 width, int32 n_words, int32 border_value, int32 invert',
+    'uint64 w',
+    '''
+    const ptrdiff_t row = i / n_words;
+    const int word = (int)(i - row * n_words);
+    unsigned long long packed = 0;
+    for (int j = 0; j < 64; j++) {
+        const ptrdiff_t col = (ptrdiff_t)word * 64 + j;
+        bool bit;
+        if (col < width) {
+            bit = (bool)x[row * width + col];
+            if (invert) bit = !bit;
+        } else {
+            // keep the tail bits of the last word at the border value so
+            // that cross-word shifts read border bits
+            bit = (bool)border_value;
+        }
+        if (bit) packed |= 1ULL << j;
+    }
+    w = packed;
+    ''', 'cupyx_scipy_ndimage_pack_bits_u64')
+
+
+_unpack_bits_u64 = _core.ElementwiseKernel(
+    'raw U w, int32 width, int32 n_words, int32 invert',
+    'Y y',
+    '''
+    const ptrdiff_t row = i / width;
+    const ptrdiff_t col = i - row * width;
+    bool bit = (w[row * n_words + col / 64] >> (col & 63)) & 1;
+    if (invert) bit = !bit;
+    y = (Y)bit;
+    ''', 'cupyx_scipy_ndimage_unpack_bits_u64')
+
+
+_packed_erosion_preamble = '''
+__device__ __forceinline__ unsigned long long _pb_get_word(
+        const unsigned long long* x, ptrdiff_t row, ptrdiff_t word,
+        int n_rows, int n_words, unsigned long long border_word) {
+    if (row < 0 || row >= n_rows || word < 0 || word >= n_words) {
+        return border_word;
+    }
+    return x[row * n_words + word];
+}
+
+// packed word holding the 64 neighbor bits at pixel offset dx, built from
+// the word at the same bit position and its neighbor via SWAR shifts
+__device__ __forceinline__ unsigned long long _pb_shift_word(
+        const unsigned long long* x, ptrdiff_t row, int word, int dx,
+        int n_rows, int n_words, unsigned long long border_word) {
+    const int s = dx & 63;
+    const int q = (dx - s) >> 6;  // floor division by 64
+    unsigned long long lo = _pb_get_word(x, row, word + q, n_rows, n_words,
+                                         border_word);
+    if (s == 0) return lo;
+    unsigned long long hi = _pb_get_word(x, row, word + q + 1, n_rows,
+                                         n_words, border_word);
+    return (lo >> s) | (hi << (64 - s));
+}
+'''
+
+
+_packed_binary_erosion_kernel = _core.ElementwiseKernel(
+    'raw U x, raw int32 offsets, int32 n_offsets, int32 n_rows, int32 width, '
+    'int32 n_words, uint64 border_word, uint64 tail_mask',
+    'uint64 y',
+    '''
+    const ptrdiff_t row = i / n_words;
+    const int word = (int)(i - row * n_words);
+    unsigned long long r = ~0ULL;
+    for (int k = 0; k < n_offsets; k++) {
+        r &= _pb_shift_word(&x[0], row + offsets[2 * k], word,
+                            offsets[2 * k + 1], n_rows, n_words, border_word);
+        if (r == 0) break;
+    }
+    if (word == n_words - 1 && tail_mask != ~0ULL) {
+        // re-impose border bits on the tail so iterating stays consistent
+        r = (r & tail_mask) | (border_word & ~tail_mask);
+    }
+    y = r;
+    ''', 'cupyx_scipy_ndimage_packed_binary_erosion',
+    preamble=_packed_erosion_preamble)
+
+
+def _binary_erosion_separable(input, structure_shape, iterations, output,
+                              border_value, origin, invert, int_type):
+    """Erosion by an all-ones box run as a series of 1-D erosions.
+
+    Erosion (dilation) by a rectangular structuring element separates into
+    one 1-D pass per axis, reducing the work per pixel from the box volume
+    to the sum of its side lengths.  Repeated erosions by the same box fold
+    into a single erosion by a larger box (Minkowski sum), so ``iterations``
+    only lengthens the per-axis kernels instead of adding passes.
+    """
+    ndim = input.ndim
+    sizes = structure_shape
+    if iterations > 1:
+        sizes = tuple(s + (iterations - 1) * (s - 1) for s in sizes)
+    axes = [j for j, s in enumerate(sizes) if s > 1]
+    if not axes:
+        _core.elementwise_copy(input, output)
+        return output
+    n = len(axes)
+    temp = cupy.empty_like(output) if n > 1 else None
+    src = input
+    dst = output if n & 1 else temp
+    for ax in axes:
+        w_shape = [1] * ndim
+        w_shape[ax] = sizes[ax]
+        offsets = [0] * ndim
+        offsets[ax] = iterations * (structure_shape[ax] // 2 + origin[ax])
+        kernel = _get_binary_erosion_kernel(
+            tuple(w_shape), int_type, tuple(offsets), True, border_value,
+            invert, False, True)
+        kernel(src, dst)
+        src = dst
+        dst = temp if src is output else output
+    return output
+
+
+def _packed_erosion_offsets(structure, structure_shape, offsets):
+    """Nonzero structure positions relative to the kernel center, on host."""
+    if isinstance(structure, tuple):
+        nz = numpy.indices(structure_shape).reshape(2, -1).T
+    else:
+        nz = numpy.argwhere(cupy.asnumpy(structure))
+    rel = nz - numpy.asarray(offsets)
+    return cupy.asarray(rel.astype(numpy.int32).ravel())
+
+
+def _binary_erosion_packed(input, structure, structure_shape, offsets,
+                           iterations, output, border_value, invert):
+    """Erosion on a bit-packed representation of a 2-D binary image.
+
+    The input rows are packed 64 pixels per uint64 word so that each bitwise
+    op in the erosion processes 64 elements at once; iterations stay on the
+    packed representation and the result is unpacked only at the end.
+    """
+    if invert:
+        border_value = int(not border_value)
+    n_rows, width = input.shape
+    n_words = (width + 63) // 64
+    off = _packed_erosion_offsets(structure, structure_shape, offsets)
+    n_off = off.size // 2
+    border_word = numpy.uint64(0xFFFFFFFFFFFFFFFF if border_value else 0)
+    tail = width % 64
+    if tail == 0:
+        tail_mask = numpy.uint64(0xFFFFFFFFFFFFFFFF)
+    else:
+        tail_mask = numpy.uint64((1 << tail) - 1)
+    packed = cupy.empty((n_rows, n_words), dtype=cupy.uint64)
+    _pack_bits_u64(input, width, n_words, border_value, int(invert), packed)
+    eroded = cupy.empty_like(packed)
+    _packed_binary_erosion_kernel(packed, off, n_off, n_rows, width, n_words,
+                                  border_word, tail_mask, eroded)
+    for _ in range(1, iterations):
+        packed, eroded = eroded, packed
+        _packed_binary_erosion_kernel(packed, off, n_off, n_rows, width,
+                                      n_words, border_word, tail_mask, eroded)
+    _unpack_bits_u64(eroded, width, n_words, int(invert), output)
+    return output
+
+
+@cupy.memoize(for_each_device=True)
+def _get_binary_open_close_kernel(offsets, ndim, int_type, border_value,
+                                  invert):
+    # Computes opening (or, with ``invert``, closing by duality) in a single
+    # pass: y[i] = OR over dilation offsets s of (AND over erosion offsets t
+    # of x[i + s + t]), with out-of-bounds reads replaced by the border value.
+    # Only valid for symmetric structuring elements, where the dilation and
+    # erosion offset sets coincide.
+    n_off = len(offsets)
+    border_value = int(bool(border_value) != bool(invert))
+    size = ('%s xsize_{j}=x.shape()[{j}], ysize_{j} = _raw_y.shape()[{j}]'
+            ', xstride_{j}=x.strides()[{j}];' % int_type)
+    sizes = [size.format(j=j) for j in range(ndim)]
+    inds = _util._generate_indices_ops(ndim, int_type, (0,) * ndim)
+    off_list = ', '.join(
+        str(x) for off in offsets for x in off)
+
+    center_checks = []
+    neighbor_coords = []
+    for j in range(ndim):
+        center_checks.append(f'''
+        {int_type} cs_{j} = ind_{j} + _off[a * {ndim} + {j}];
+        center_oob |= (cs_{j} < 0) || (cs_{j} >= xsize_{j});''')
+        neighbor_coords.append(f'''
+            {int_type} p_{j} = cs_{j} + _off[b * {ndim} + {j}];
+            oob |= (p_{j} < 0) || (p_{j} >= xsize_{j});
+            if (!oob) byte += p_{j} * xstride_{j};''')
+
+    read = 'v = (bool)(*(X*)&data[byte]);'
+    if invert:
+        read += ' v = !v;'
+
+    operation = '''
+    {sizes}
+    {inds}
+    const unsigned char* data = (const unsigned char*)&x[0];
+    const int _off[] = {{ {off_list} }};
+    bool result = false;
+    for (int a = 0; a < {n_off} && !result; a++) {{
+        bool center_oob = false;
+        {center_checks}
+        if (center_oob) {{
+            result = {border_value};
+            continue;
+        }}
+        bool all_true = true;
+        for (int b = 0; b < {n_off} && all_true; b++) {{
+            bool oob = false;
+            {int_type} byte = 0;
+            {neighbor_coords}
+            bool v;
+            if (oob) {{
+                v = {border_value};
+            }} else {{
+                {read}
+            }}
+            all_true = v;
+        }}
+        result = all_true;
+    }}
+    y = (Y)({result_expr});
+    '''.format(sizes='\n'.join(sizes), inds=inds, off_list=off_list,
+               n_off=n_off, border_value=border_value, int_type=int_type,
+               center_checks='\n'.join(center_checks),
+               neighbor_coords='\n'.join(neighbor_coords), read=read,
+               result_expr='!result' if invert else 'result')
+
+    name = 'cupyx_scipy_ndimage_binary_{}_{}d_n{}'.format(
+        'closing' if invert else 'opening', ndim, n_off)
+    if int_type == 'ptrdiff_t':
+        name += '_i64'
+    return cupy.ElementwiseKernel(
+        'raw X x', 'Y y', operation, name, reduce_dims=False,
+        preamble=_filters_core.includes + _filters_core._CAST_FUNCTION,
+        options=('--std=c++11', '-DCUPY_USE_JITIFY'))
+
+
+def _symmetric_structure_offsets(structure, ndim):
+    """Host-known offsets of a symmetric structuring element, or ``None``."""
+    if structure is None:
+        offs = [(0,) * ndim]
+        for j in range(ndim):
+            for d in (-1, 1):
+                off = [0] * ndim
+                off[j] = d
+                offs.append(tuple(off))
+        return tuple(offs)
+    if isinstance(structure, int):
+        structure = (structure,) * ndim
+    if isinstance(structure, (list, tuple)):
+        shape = tuple(structure)
+        if len(shape) != ndim or any(s < 1 or not s & 1 for s in shape):
+            return None
+        if math.prod(shape) ** 2 > 4096:
+            # the fused kernel does |S|**2 reads per pixel; past this point
+            # the two-pass path wins despite the intermediate array
+            return None
+        grid = numpy.indices(shape).reshape(ndim, -1).T
+        center = numpy.array([s // 2 for s in shape])
+        return tuple(map(tuple, (grid - center).tolist()))
+    return None
+
+
+def _binary_open_close_fused(input, offsets, output, border_value, invert):
+    int_type = _util._get_inttype(input)
+    kernel = _get_binary_open_close_kernel(
+        offsets, input.ndim, int_type, int(bool(border_value)), int(invert))
+    if not isinstance(output, cupy.ndarray):
+        output = bool
+    output = _util._get_output(output, input)
+    needs_temp = cupy.shares_memory(output, input, 'MAY_SHARE_BOUNDS')
+    if needs_temp:
+        output, temp = _util._get_output(output.dtype, input), output
+    kernel(input, output)
+    if needs_temp:
+        _core.elementwise_copy(output, temp)
+        output = temp
+    return output
+
+
+@cupy.memoize(for_each_device=True)
+def _get_binary_erosion_tiled_kernel(rel, border_value, invert):
+    # Shared-memory tiled erosion for 3-D inputs with large structuring
+    # elements.  Each block loads its tile plus halo once, so every input
+    # voxel is read from global memory about once instead of once per
+    # structure element.
+    if invert:
+        border_value = int(not border_value)
+    lo = [min(r[j] for r in rel) for j in range(3)]
+    hi = [max(r[j] for r in rel) for j in range(3)]
+    bz, by, bx = 4, 8, 8
+    tz = bz + hi[0] - lo[0]
+    ty = by + hi[1] - lo[1]
+    tx = bx + hi[2] - lo[2]
+    n = len(rel)
+    rz = ', '.join(str(r[0] - lo[0]) for r in rel)
+    ry = ', '.join(str(r[1] - lo[1]) for r in rel)
+    rx = ', '.join(str(r[2] - lo[2]) for r in rel)
+    read = '!v' if invert else 'v'
+    out = '!r' if invert else 'r'
+    name = 'cupyx_scipy_ndimage_binary_erosion_tiled_n{}'.format(n)
+    code = f'''
+extern "C" __global__ void {name}(
+        const unsigned char* x, unsigned char* y, int d0, int d1, int d2) {{
+    const int z0 = blockIdx.z * {bz};
+    const int y0 = blockIdx.y * {by};
+    const int x0 = blockIdx.x * {bx};
+    __shared__ unsigned char tile[{tz}][{ty}][{tx}];
+    for (int k = threadIdx.z; k < {tz}; k += {bz}) {{
+        for (int j = threadIdx.y; j < {ty}; j += {by}) {{
+            for (int i = threadIdx.x; i < {tx}; i += {bx}) {{
+                const int gz = z0 + k + {lo[0]};
+                const int gy = y0 + j + {lo[1]};
+                const int gx = x0 + i + {lo[2]};
+                unsigned char v;
+                if (gz < 0 || gz >= d0 || gy < 0 || gy >= d1 ||
+                        gx < 0 || gx >= d2) {{
+                    v = {border_value};
+                }} else {{
+                    v = x[((size_t)gz * d1 + gy) * d2 + gx] != 0;
+                    v = {read};
+                }}
+                tile[k][j][i] = v;
+            }}
+        }}
+    }}
+    __syncthreads();
+    const int gz = z0 + threadIdx.z;
+    const int gy = y0 + threadIdx.y;
+    const int gx = x0 + threadIdx.x;
+    if (gz >= d0 || gy >= d1 || gx >= d2) return;
+    const int rz[] = {{ {rz} }};
+    const int ry[] = {{ {ry} }};
+    const int rx[] = {{ {rx} }};
+    unsigned char r = 1;
+    for (int m = 0; m < {n}; m++) {{
+        if (!tile[threadIdx.z + rz[m]][threadIdx.y + ry[m]]
+                 [threadIdx.x + rx[m]]) {{
+            r = 0;
+            break;
+        }}
+    }}
+    y[((size_t)gz * d1 + gy) * d2 + gx] = {out};
+}}
+'''
+    return cupy.RawKernel(code, name)
+
+
+def _binary_erosion_tiled(input, positions, offsets, iterations, output,
+                          border_value, invert):
+    rel = tuple(
+        tuple(int(p[j]) - offsets[j] for j in range(3)) for p in positions)
+    kernel = _get_binary_erosion_tiled_kernel(
+        rel, int(border_value), int(invert))
+    d0, d1, d2 = input.shape
+    grid = ((d2 + 7) // 8, (d1 + 7) // 8, (d0 + 3) // 4)
+    block = (8, 8, 4)
+    args = (numpy.int32(d0), numpy.int32(d1), numpy.int32(d2))
+    # alternate between output and a temporary so the final write lands in
+    # output
+    src = input
+    tmp = cupy.empty_like(output) if iterations > 1 else None
+    dst = output if iterations & 1 else tmp
+    for _ in range(iterations):
+        kernel(grid, block, (src, dst) + args)
+        src = dst
+        dst = tmp if src is output else output
+    return output
+
+
+@cupy.memoize(for_each_device=True)
+def _get_binary_hit_or_miss_kernel(rel1, rel2, ndim, int_type):
+    # Single-sweep hit-or-miss: per pixel, every structure1 neighbor must be
+    # true (out-of-bounds counts as false) and every structure2 neighbor must
+    # be false (out-of-bounds passes).  Equivalent to the two-erosion
+    # composition with border_value=0 but without the intermediates.
+    size = ('%s xsize_{j}=x.shape()[{j}], ysize_{j} = _raw_y.shape()[{j}]'
+            ', xstride_{j}=x.strides()[{j}];' % int_type)
+    sizes = [size.format(j=j) for j in range(ndim)]
+    inds = _util._generate_indices_ops(ndim, int_type, (0,) * ndim)
+
+    def block(rel, want_true):
+        coords = '\n'.join(
+            f'{int_type} ix_{j} = ind_{j} + {rel[j]};' for j in range(ndim))
+        cond = ' || '.join(
+            f'(ix_{j} < 0) || (ix_{j} >= xsize_{j})' for j in range(ndim))
+        expr = ' + '.join(f'ix_{j} * xstride_{j}' for j in range(ndim))
+        if want_true:
+            body = f'''
+        if (({cond}) || !(*(X*)&data[{expr}])) {{
+            y = cast<Y>(0);
+            return;
+        }}'''
+        else:
+            body = f'''
+        if (!({cond}) && (*(X*)&data[{expr}])) {{
+            y = cast<Y>(0);
+            return;
+        }}'''
+        return f'''
+    {{
+        {coords}
+        {body}
+    }}'''
+
+    blocks = [block(rel, True) for rel in rel1]
+    blocks += [block(rel, False) for rel in rel2]
+
+    operation = '''
+    {sizes}
+    {inds}
+    const unsigned char* data = (const unsigned char*)&x[0];
+    {blocks}
+    y = cast<Y>(1);
+    '''.format(sizes='\n'.join(sizes), inds=inds, blocks='\n'.join(blocks))
+
+    name = 'cupyx_scipy_ndimage_binary_hit_or_miss_{}d_n{}_m{}'.format(
+        ndim, len(rel1), len(rel2))
+    if int_type == 'ptrdiff_t':
+        name += '_i64'
+    preamble = _filters_core.includes + _filters_core._CAST_FUNCTION
+    return cupy.ElementwiseKernel(
+        'raw X x', 'Y y', operation, name, reduce_dims=False,
+        preamble=preamble, options=('--std=c++11', '-DCUPY_USE_JITIFY'))
+
+
+_hit_or_miss_combine = _core.ElementwiseKernel(
+    'X t1, W t2', 'Y y', 'y = t1 && !t2',
+    'cupyx_scipy_ndimage_hit_or_miss_combine')
+
+
+def _hit_or_miss_rel_offsets(structure, origin):
+    positions = numpy.argwhere(cupy.asnumpy(structure))
+    center = numpy.array(
+        [s // 2 + o for s, o in zip(structure.shape, origin)])
+    return tuple(map(tuple, (positions - center).tolist()))
+
+
+def _structure_stats(structure, origin):
+    """Nonzero count and center element of ``structure`` in one transfer."""
     coor = tuple([oo + ss // 2 for ss, oo in zip(structure.shape, origin)])
-    return bool(structure[coor])  # device synchronization
+    stats = cupy.empty(2, dtype=cupy.int64)
+    stats[0] = cupy.count_nonzero(structure)
+    stats[1] = structure[coor]
+    nnz, center = stats.get()  # device synchronization
+    return int(nnz), bool(center)
 
 
 def iterate_structure(structure, iterations, origin=None):
@@ -109,9 +678,26 @@ def iterate_structure(structure, iterations, origin=None):
         slice(pos[ii], pos[ii] + structure.shape[ii], None)
         for ii in range(len(shape))
     )
-    out = cupy.zeros(shape, bool)
-    out[slc] = structure != 0
-    out = binary_dilation(out, structure, iterations=ni)
+    # The structuring element is tiny, so the iterated dilation (a Minkowski
+    # sum of the structure with itself) is computed on the host with NumPy
+    # instead of launching ``ni`` dilation kernels, and uploaded once.
+    structure_cpu = cupy.asnumpy(structure) != 0
+    out_cpu = numpy.zeros(shape, bool)
+    out_cpu[slc] = structure_cpu
+    nz = numpy.argwhere(structure_cpu) - numpy.array(
+        [s // 2 for s in structure_cpu.shape])
+    for _ in range(ni):
+        dilated = numpy.zeros_like(out_cpu)
+        for offset in nz:
+            src_slc = tuple(
+                slice(max(0, -o), out_cpu.shape[d] - max(0, o))
+                for d, o in enumerate(offset))
+            dst_slc = tuple(
+                slice(max(0, o), out_cpu.shape[d] - max(0, -o))
+                for d, o in enumerate(offset))
+            dilated[dst_slc] |= out_cpu[src_slc]
+        out_cpu = dilated
+    out = cupy.asarray(out_cpu)
     if origin is None:
         return out
     else:
@@ -140,6 +726,17 @@ def generate_binary_structure(rank, connectivity):
 
     .. seealso:: :func:`scipy.ndimage.generate_binary_structure`
     """
+    # The array for each (rank, connectivity) is cached on the device;
+    # return a copy so that callers are free to modify it.
+    return _generate_binary_structure(rank, connectivity).copy()
+
+
+@cupy.memoize(for_each_device=True)
+def _generate_binary_structure(rank, connectivity):
+    # Cached variant of generate_binary_structure for internal use: the
+    # default structure is rebuilt (host compute plus H2D copy) on every
+    # morphology call with structure=None, so share one device array per
+    # (rank, connectivity).  Callers must not modify the result.
     if connectivity < 1:
         connectivity = 1
     if rank < 1:
@@ -150,6 +747,25 @@ def generate_binary_structure(rank, connectivity):
     return cupy.asarray(output)
 
 
+_morph_laplace_combine = _core.ElementwiseKernel(
+    'T a, T b, T x', 'T y', 'y = a + b - 2 * x',
+    'cupyx_scipy_ndimage_morph_laplace_combine')
+
+
+_diff_any = _core.ReductionKernel(
+    'T a, T b', 'uint32 y',
+    '(a != b) ? 1u : 0u', 'a | b', 'y = a', '0',
+    'cupyx_scipy_ndimage_diff_any')
+
+
+@functools.lru_cache(maxsize=128)
+def _erosion_origins_offsets(origin, ndim, structure_shape):
+    # Host-only computation; cached so that repeated calls with the same
+    # origin/structure shape skip the per-axis validation loop.
+    origin = tuple(_util._fix_sequence_arg(origin, ndim, 'origin', int))
+    return origin, _filters_core._origins_to_offsets(origin, structure_shape)
+
+
 def _binary_erosion(input, structure, iterations, mask, output, border_value,
                     origin, invert, brute_force=True):
     try:
@@ -160,7 +776,7 @@ def _binary_erosion(input, structure, iterations, mask, output, border_value,
     if input.dtype.kind == 'c':
         raise TypeError('Complex type not supported')
     if structure is None:
-        structure = generate_binary_structure(input.ndim, 1)
+        structure = _generate_binary_structure(input.ndim, 1)
         all_weights_nonzero = input.ndim == 1
         center_is_true = True
         structure_shape = structure.shape
@@ -170,7 +786,11 @@ def _binary_erosion(input, structure, iterations, mask, output, border_value,
         if len(structure_shape) == 0:
             raise RuntimeError("structure must not be empty")
     else:
-        structure = structure.astype(dtype=bool, copy=False)
+        if structure.dtype.itemsize == 1 and structure.dtype.kind in 'iu':
+            # same-size integer types can be reinterpreted without a copy
+            structure = structure.view(bool)
+        else:
+            structure = structure.astype(dtype=bool, copy=False)
         structure_shape = structure.shape
         # transfer to CPU for use in determining if it is fully dense
         # structure_cpu = cupy.asnumpy(structure)
@@ -190,7 +810,10 @@ def _binary_erosion(input, structure, iterations, mask, output, border_value,
         masked = True
     else:
         masked = False
-    origin = _util._fix_sequence_arg(origin, input.ndim, 'origin', int)
+    if not isinstance(origin, (int, tuple)):
+        origin = tuple(origin)
+    origin, offsets = _erosion_origins_offsets(
+        origin, input.ndim, structure_shape)
 
     if isinstance(output, cupy.ndarray):
         if output.dtype.kind == 'c':
@@ -210,27 +833,79 @@ def _binary_erosion(input, structure, iterations, mask, output, border_value,
         else:
             output[...] = ~cupy.asarray(input, dtype=bool)
         return output
-    origin = tuple(origin)
     int_type = _util._get_inttype(input)
-    offsets = _filters_core._origins_to_offsets(origin, structure_shape)
     if isinstance(structure, tuple):
         nnz = math.prod(structure_shape)
         all_weights_nonzero = True
         center_is_true = True
     else:
-        # synchronize required to determine if all weights are non-zero
-        nnz = int(cupy.count_nonzero(structure))
+        # synchronize required to determine if all weights are non-zero;
+        # the nonzero count and the center element are fetched together so
+        # that only a single round trip is needed
+        nnz, center_is_true = _structure_stats(structure, origin)
         all_weights_nonzero = nnz == structure.size
         if all_weights_nonzero:
             center_is_true = True
-        else:
-            center_is_true = _center_is_true(structure, origin)
 
-    erode_kernel = _get_binary_erosion_kernel(
-        structure_shape, int_type, offsets, center_is_true, border_value,
-        invert, masked, all_weights_nonzero,
-    )
-    if all_weights_nonzero:
+    if (isinstance(structure, tuple) and not masked and iterations >= 1
+            and (iterations == 1 or brute_force)
+            and sum(s > 1 for s in structure_shape) >= 2):
+        # all-ones box: separable, one 1-D erosion per axis
+        output = _binary_erosion_separable(
+            input, structure_shape, iterations, output, border_value, origin,
+            invert, int_type)
+        if temp_needed:
+            _core.elementwise_copy(output, temp)
+            output = temp
+        return output
+
+    if (input.ndim == 2 and not masked and iterations >= 1
+            and (iterations == 1 or brute_force or not center_is_true)
+            and input.flags.c_contiguous and input.shape[-1] >= 128):
+        # bit-packed fast path: one bitwise op processes 64 pixels
+        output = _binary_erosion_packed(
+            input, structure, structure_shape, offsets, iterations, output,
+            border_value, invert)
+        if temp_needed:
+            _core.elementwise_copy(output, temp)
+            output = temp
+        return output
+
+    if (input.ndim == 3 and not masked and iterations >= 1
+            and (iterations == 1 or brute_force or not center_is_true)
+            and not isinstance(structure, tuple)
+            and max(structure_shape) >= 5 and 0 < nnz <= 1024
+            and input.dtype.itemsize == 1 and input.flags.c_contiguous
+            and output.dtype.itemsize == 1 and output.flags.c_contiguous
+            and input.size < (1 << 31)):
+        # large 3-D structuring element: shared-memory tiled kernel reads
+        # each input voxel about once instead of once per structure element
+        positions = tuple(
+            map(tuple, numpy.argwhere(cupy.asnumpy(structure)).tolist()))
+        output = _binary_erosion_tiled(input, positions, offsets, iterations,
+                                       output, border_value, invert)
+        if temp_needed:
+            _core.elementwise_copy(output, temp)
+            output = temp
+        return output
+
+    # For sparse structures with few true elements the positions are pulled
+    # to the host (count_nonzero above already synchronized) and baked into
+    # an unrolled kernel, skipping the bounding-box loop and weight fetches.
+    unrolled = (not all_weights_nonzero
+                and not isinstance(structure, tuple) and nnz <= 32)
+    if unrolled:
+        positions = tuple(
+            map(tuple, numpy.argwhere(cupy.asnumpy(structure)).tolist()))
+        erode_kernel = _get_binary_erosion_unrolled_kernel(
+            positions, structure_shape, int_type, offsets, center_is_true,
+            border_value, invert, masked)
+    else:
+        erode_kernel = _get_binary_erosion_kernel(
+            structure_shape, int_type, offsets, center_is_true, border_value,
+            invert, masked, all_weights_nonzero,
+        )
+    if all_weights_nonzero or unrolled:
         if masked:
             in_args = (input, mask)
         else:
@@ -248,19 +923,36 @@ def _binary_erosion(input, structure, iterations, mask, output, border_value,
             'only brute_force iteration has been implemented'
         )
     else:
-        if cupy.shares_memory(output, input, 'MAY_SHARE_BOUNDS'):
-            raise ValueError('output and input may not overlap in memory')
+        # output cannot overlap input here: any overlapping output array was
+        # already replaced by a temporary when temp_needed was determined
         tmp_in = cupy.empty_like(input, dtype=output.dtype)
         tmp_out = output
         if iterations >= 1 and not iterations & 1:
             tmp_in, tmp_out = tmp_out, tmp_in
         tmp_out = erode_kernel(*in_args, tmp_out)
-        # TODO: kernel doesn't return the changed status, so determine it here
-        changed = not (input == tmp_out).all()  # synchronize!
+        # Reading the convergence flag back on every iteration would force a
+        # device synchronization per step, serializing the whole pipeline.
+        # Run the comparison on a side stream every ``check_interval``
+        # iterations and read its result one interval later, so the transfer
+        # only ever waits on the (long finished) comparison instead of
+        # draining the queued erosions; erosions past convergence are no-ops
+        # so the result is unaffected.
+        check_interval = 8
+        compare_stream = cupy.cuda.Stream(non_blocking=True)
+        pending = None
+        changed = True
+        if iterations < 1:
+            # seed the pipeline with the first iteration's comparison rather
+            # than synchronizing on it here; already-converged inputs run a
+            # few redundant (no-op) iterations instead of stalling every call
+            compare_stream.wait_event(cupy.cuda.get_current_stream().record())
+            with compare_stream:
+                pending = _diff_any(input, tmp_out)
+            cupy.cuda.get_current_stream().wait_event(compare_stream.record())
         ii = 1
         while ii < iterations or ((iterations < 1) and changed):
             tmp_in, tmp_out = tmp_out, tmp_in
-            if all_weights_nonzero:
+            if all_weights_nonzero or unrolled:
                 if masked:
                     in_args = (tmp_in, mask)
                 else:
@@ -271,12 +963,24 @@ def _binary_erosion(input, structure, iterations, mask, output, border_value,
                 else:
                     in_args = (tmp_in, structure)
             tmp_out = erode_kernel(*in_args, tmp_out)
-            changed = not (tmp_in == tmp_out).all()
             ii += 1
-            if not changed and (not ii & 1):  # synchronize!
+            if (not ii & 1) and not ii % check_interval:
                 # can exit early if nothing changed
                 # (only do this after even number of tmp_in/out swaps)
-                break
+                if pending is not None:
+                    with compare_stream:
+                        changed = bool(pending)
+                    pending = None
+                    if not changed:
+                        break
+                compare_stream.wait_event(
+                    cupy.cuda.get_current_stream().record())
+                with compare_stream:
+                    pending = _diff_any(tmp_in, tmp_out)
+                # the next erosion overwrites tmp_in; keep it ordered after
+                # the comparison has read it
+                cupy.cuda.get_current_stream().wait_event(
+                    compare_stream.record())
         output = tmp_out
     if temp_needed:
         _core.elementwise_copy(output, temp)
@@ -286,7 +990,7 @@ def _binary_erosion(input, structure, iterations, mask, output, border_value,
 
 def _prep_structure(structure, ndim):
     if structure is None:
-        structure = generate_binary_structure(ndim, 1)
+        structure = _generate_binary_structure(ndim, 1)
         return structure, structure.shape, True
     if isinstance(structure, int):
         structure = (structure,) * ndim
@@ -449,6 +1153,12 @@ def binary_opening(input, structure=None, iterations=1, output=None, origin=0,
 
     .. seealso:: :func:`scipy.ndimage.binary_opening`
     """
+    if iterations == 1 and mask is None and input.dtype.kind != 'c':
+        offsets = _symmetric_structure_offsets(structure, input.ndim)
+        origins = _util._fix_sequence_arg(origin, input.ndim, 'origin', int)
+        if offsets is not None and not any(origins):
+            return _binary_open_close_fused(input, offsets, output,
+                                            border_value, False)
     structure, _, _ = _prep_structure(structure, input.ndim)
     tmp = binary_erosion(input, structure, iterations, mask, None,
                          border_value, origin, brute_force)
@@ -503,6 +1213,12 @@ def binary_closing(input, structure=None, iterations=1, output=None, origin=0,
 
     .. seealso:: :func:`scipy.ndimage.binary_closing`
     """
+    if iterations == 1 and mask is None and input.dtype.kind != 'c':
+        offsets = _symmetric_structure_offsets(structure, input.ndim)
+        origins = _util._fix_sequence_arg(origin, input.ndim, 'origin', int)
+        if offsets is not None and not any(origins):
+            return _binary_open_close_fused(input, offsets, output,
+                                            border_value, True)
     structure, _, _ = _prep_structure(structure, input.ndim)
     tmp = binary_dilation(input, structure, iterations, mask, None,
                           border_value, origin, brute_force)
@@ -548,7 +1264,7 @@ def binary_hit_or_miss(input, structure1=None, structure2=None, output=None,
     .. seealso:: :func:`scipy.ndimage.binary_hit_or_miss`
     """
     if structure1 is None:
-        structure1 = generate_binary_structure(input.ndim, 1)
+        structure1 = _generate_binary_structure(input.ndim, 1)
     if structure2 is None:
         structure2 = cupy.logical_not(structure1)
     origin1 = _util._fix_sequence_arg(origin1, input.ndim, 'origin1', int)
@@ -557,17 +1273,41 @@ def binary_hit_or_miss(input, structure1=None, structure2=None, output=None,
     else:
         origin2 = _util._fix_sequence_arg(origin2, input.ndim, 'origin2', int)
 
+    if (input.dtype.kind != 'c' and structure1.ndim == input.ndim
+            and structure2.ndim == input.ndim
+            and structure1.size <= 125 and structure2.size <= 125):
+        # small structures: test both parts per pixel in one fused sweep
+        # (the host fetch of the structures replaces the synchronizations
+        # the two erosion calls would have done anyway)
+        rel1 = _hit_or_miss_rel_offsets(structure1, origin1)
+        rel2 = _hit_or_miss_rel_offsets(structure2, origin2)
+        if len(rel1) + len(rel2) <= 64:
+            kernel = _get_binary_hit_or_miss_kernel(
+                rel1, rel2, input.ndim, _util._get_inttype(input))
+            out = output if isinstance(output, cupy.ndarray) else bool
+            out = _util._get_output(out, input)
+            needs_temp = cupy.shares_memory(out, input, 'MAY_SHARE_BOUNDS')
+            if needs_temp:
+                out, temp = _util._get_output(out.dtype, input), out
+            kernel(input, out)
+            if needs_temp:
+                _core.elementwise_copy(out, temp)
+                out = temp
+            if isinstance(output, cupy.ndarray):
+                return None
+            return out
+
     tmp1 = _binary_erosion(input, structure1, 1, None, None, 0, origin1, 0,
                            False)
     inplace = isinstance(output, cupy.ndarray)
     result = _binary_erosion(input, structure2, 1, None, output, 0, origin2, 1,
                              False)
+    # single fused pass instead of logical_not followed by logical_and
     if inplace:
-        cupy.logical_not(output, output)
-        cupy.logical_and(tmp1, output, output)
+        _hit_or_miss_combine(tmp1, output, output)
     else:
-        cupy.logical_not(result, result)
-        return cupy.logical_and(tmp1, result)
+        _hit_or_miss_combine(tmp1, result, result)
+        return result
 
 
 def binary_propagation(input, structure=None, mask=None, output=None,
@@ -603,7 +1343,8 @@ def binary_propagation(input, structure=None, mask=None, output=None,
                            origin, brute_force=True)
 
 
-def binary_fill_holes(input, structure=None, output=None, origin=0):
+def binary_fill_holes(input, structure=None, output=None, origin=0, *,
+                      tile=None, halo=None):
     """Fill the holes in binary objects.
 
     Args:
@@ -618,6 +1359,15 @@ def binary_fill_holes(input, structure=None, output=None, origin=0):
             is created.
         origin (int, tuple of ints, optional): Position of the structuring
             element.
+        tile (int, sequence of ints, 'auto' or None, optional): If given, the
+            volume is processed in overlapping tiles of this shape to bound
+            peak memory use; ``'auto'`` picks a tile size along the first axis
+            from the free device memory. Only supported with the default
+            ``structure`` and zero ``origin``.
+        halo (int or sequence of ints, optional): Overlap added on every side
+            of each tile. The tiled result is exact as long as every hole
+            extends at most ``halo`` voxels along each axis; larger holes may
+            be left unfilled. Defaults to half the tile size.
 
     Returns:
         cupy.ndarray: Transformation of the initial image ``input`` where holes
@@ -629,6 +1379,13 @@ def binary_fill_holes(input, structure=None, output=None, origin=0):
 
     .. seealso:: :func:`scipy.ndimage.binary_fill_holes`
     """
+    if structure is None and numpy.all(numpy.asarray(origin) == 0):
+        if tile is not None and input.ndim > 0:
+            return _binary_fill_holes_tiled(input, output, tile, halo)
+        return _binary_fill_holes_non_iterative(input, output)
+    if tile is not None:
+        raise NotImplementedError(
+            'tile is only supported with the default structure and origin 0')
     mask = cupy.logical_not(input)
     tmp = cupy.zeros(mask.shape, bool)
     inplace = isinstance(output, cupy.ndarray)
@@ -644,6 +1401,171 @@ def binary_fill_holes(input, structure=None, output=None, origin=0):
         return output
 
 
+_fill_holes_combine = _core.ElementwiseKernel(
+    'L lbl, M m, raw L bg', 'Y out',
+    'out = (m != 0) || ((lbl != bg[0]) && (lbl != bg[1]))',
+    'cupyx_scipy_ndimage_fill_holes_combine')
+
+
+@cupy.memoize(for_each_device=True)
+def _get_fill_holes_invert_pad_kernel(ndim, int_type):
+    # Writes the inverted input into a 1-voxel-padded output in one pass,
+    # replacing the mask allocation, zeros+copy and logical_not chain (three
+    # full passes over the volume) that built it before.
+    size = ('%s xsize_{j}=x.shape()[{j}], ysize_{j} = _raw_y.shape()[{j}]'
+            ', xstride_{j}=x.strides()[{j}];' % int_type)
+    sizes = [size.format(j=j) for j in range(ndim)]
+    inds = _util._generate_indices_ops(ndim, int_type, (1,) * ndim)
+    cond = ' || '.join(
+        f'(ind_{j} < 0) || (ind_{j} >= xsize_{j})' for j in range(ndim))
+    expr = ' + '.join(f'ind_{j} * xstride_{j}' for j in range(ndim))
+    operation = f'''
+    {chr(10).join(sizes)}
+    {inds}
+    const unsigned char* data = (const unsigned char*)&x[0];
+    if ({cond}) {{
+        y = true;
+    }} else {{
+        y = (*(X*)&data[{expr}]) ? false : true;
+    }}'''
+    name = f'cupyx_scipy_ndimage_fill_holes_invert_pad_{ndim}d'
+    if int_type == 'ptrdiff_t':
+        name += '_i64'
+    return cupy.ElementwiseKernel('raw X x', 'bool y', operation, name,
+                                  reduce_dims=False)
+
+
+def _binary_fill_holes_non_iterative(input, output=None):
+    # Fill holes by labeling the complement and keeping the components that
+    # do not touch the border, instead of dilating iteratively until
+    # convergence. The final mask | (label != background) is fused into a
+    # single kernel writing straight into the output array.
+    ndim = input.ndim
+    if ndim == 0:
+        # match the iterative path: a 0-d "image" has no holes
+        filled = (input != 0)
+        inplace = isinstance(output, cupy.ndarray)
+        if inplace:
+            output[...] = filled
+            return None
+        return filled
+    labels, background = _fill_holes_labels(input)
+    inplace = isinstance(output, cupy.ndarray)
+    if inplace:
+        _fill_holes_combine(labels, input, background, output)
+        return None
+    output = _util._get_output(bool, input)
+    _fill_holes_combine(labels, input, background, output)
+    return output
+
+
+def _fill_holes_labels(input):
+    # pad with one background voxel per side so the outside is a single
+    # connected component whose label can be read from any corner; the
+    # padded complement is written directly from the input in one pass
+    inverse = cupy.empty(tuple(s + 2 for s in input.shape), dtype=bool)
+    inner = tuple(slice(1, 1 + s) for s in input.shape)
+    _get_fill_holes_invert_pad_kernel(
+        input.ndim, _util._get_inttype(inverse))(input, inverse)
+    # default structure (connectivity 1) for the complement matches the
+    # default structuring element of the dilation-based algorithm
+    inverse_labels, _ = _measurements.label(inverse)
+    # the border labels are read by the combine kernel straight from device
+    # memory, so no host synchronization is issued. For ndim >= 2 the padded
+    # border is a single face-connected component and the two extreme
+    # corners carry the same label, but in 1-D the padded endpoints are not
+    # connected to each other, so both must count as background
+    flat = inverse_labels.ravel()
+    background = cupy.concatenate([flat[:1], flat[-1:]])
+    return inverse_labels[inner], background
+
+
+def _auto_tile_shape(input):
+    # Size the tile so the labeling pass over the padded complement (two
+    # int32 label arrays plus the bool complement, roughly 16 bytes/voxel)
+    # fits comfortably in the currently free memory. Tiling is done along
+    # the first axis only, matching how large volumes are usually sliced.
+    free_device, _ = cupy.cuda.runtime.memGetInfo()
+    free_pool = cupy.get_default_memory_pool().free_bytes()
+    budget = (free_device + free_pool) // 4
+    plane = 1
+    for s in input.shape[1:]:
+        plane *= s
+    depth = max(1, budget // (16 * max(plane, 1)))
+    return [min(input.shape[0], depth)] + list(input.shape[1:])
+
+
+def _binary_fill_holes_tiled(input, output, tile, halo):
+    # Run the label-based fill per overlapping tile and copy back only the
+    # core region. A hole intersecting a tile core that extends at most
+    # halo voxels per axis lies entirely inside the padded tile, where it
+    # cannot touch the padded border and is therefore filled exactly as in
+    # the global algorithm; background connected to the outside always
+    # reaches the padded border and is left alone. Holes larger than the
+    # halo may span a seam and stay unfilled, which the halo argument
+    # documents as the caller's bound on the expected hole size.
+    ndim = input.ndim
+    if tile == 'auto':
+        tiles = _auto_tile_shape(input)
+    else:
+        tiles = _util._fix_sequence_arg(tile, ndim, 'tile', int)
+    if any(t < 1 for t in tiles):
+        raise ValueError('tile sizes must be positive')
+    if halo is None:
+        halos = [max(1, t // 2) for t in tiles]
+    else:
+        halos = _util._fix_sequence_arg(halo, ndim, 'halo', int)
+        if any(h < 0 for h in halos):
+            raise ValueError('halo must be non-negative')
+    inplace = isinstance(output, cupy.ndarray)
+    out = output if inplace else _util._get_output(bool, input)
+    starts = [range(0, s, t) for s, t in zip(input.shape, tiles)]
+    for corner in itertools.product(*starts):
+        core = tuple(
+            slice(c, min(c + t, s))
+            for c, t, s in zip(corner, tiles, input.shape))
+        padded = tuple(
+            slice(max(0, sl.start - h), min(sl.stop + h, s))
+            for sl, h, s in zip(core, halos, input.shape))
+        labels, background = _fill_holes_labels(input[padded])
+        inner = tuple(
+            slice(c.start - p.start, c.stop - p.start)
+            for c, p in zip(core, padded))
+        # the combine is elementwise, so it can write the core region
+        # straight into the output view without a per-tile buffer
+        _fill_holes_combine(
+            labels[inner], input[core], background, out[core])
+    return None if inplace else out
+
+
+def _grey_to_binary_box(input, size, footprint, structure, mode, origin):
+    # grey morphology on bool data with a flat full box is plain binary
+    # morphology; return the box shape (as a tuple structure) when the
+    # dispatch is exact, else None. For centered odd boxes the 'reflect',
+    # 'mirror' and 'nearest' modes only ever re-read values already inside
+    # the window, so they coincide with treating out-of-bounds as inert.
+    if input.dtype != bool or structure is not None:
+        return None
+    if mode not in ('reflect', 'mirror', 'nearest'):
+        return None
+    if not bool(numpy.all(numpy.asarray(origin) == 0)):
+        return None
+    if footprint is None:
+        sizes = _util._fix_sequence_arg(size, input.ndim, 'size', int)
+        if all(s % 2 == 1 for s in sizes):
+            return tuple(sizes)
+        return None
+    if isinstance(footprint, cupy.ndarray):
+        footprint = cupy.asnumpy(footprint)  # small; synchronizes
+    else:
+        footprint = numpy.asarray(footprint)
+    if (footprint.ndim == input.ndim and footprint.size > 0
+            and all(s % 2 == 1 for s in footprint.shape)
+            and bool(footprint.astype(bool).all())):
+        return footprint.shape
+    return None
+
+
 def grey_erosion(input, size=None, footprint=None, structure=None, output=None,
                  mode='reflect', cval=0.0, origin=0):
     """Calculates a greyscale erosion.
@@ -680,6 +1602,14 @@ def grey_erosion(input, size=None, footprint=None, structure=None, output=None,
     if size is None and footprint is None and structure is None:
         raise ValueError('size, footprint or structure must be specified')
 
+    box = _grey_to_binary_box(input, size, footprint, structure, mode, origin)
+    if box is not None:
+        # bool images with a flat box element: the binary kernels (bitwise,
+        # separable and bit-packed fast paths) are much faster than the grey
+        # min/max comparisons; border_value=1 makes out-of-bounds pixels
+        # inert, which matches these modes for centered odd boxes
+        return binary_erosion(input, box, 1, None, output, 1, 0,
+                              brute_force=True)
     return _filters._min_or_max_filter(input, size, footprint, structure,
                                        output, mode, cval, origin, 'min')
 
@@ -719,20 +1649,28 @@ def grey_dilation(input, size=None, footprint=None, structure=None,
 
     if size is None and footprint is None and structure is None:
         raise ValueError('size, footprint or structure must be specified')
-    if structure is not None:
-        structure = cupy.array(structure)
-        structure = structure[tuple([slice(None, None, -1)] * structure.ndim)]
-    if footprint is not None:
-        footprint = cupy.array(footprint)
-        footprint = footprint[tuple([slice(None, None, -1)] * footprint.ndim)]
-
+    box = _grey_to_binary_box(input, size, footprint, structure, mode, origin)
+    if box is not None:
+        # see grey_erosion: for dilation out-of-bounds pixels are inert with
+        # border_value=0
+        return binary_dilation(input, box, 1, None, output, 0, 0,
+                               brute_force=True)
+    return _grey_dilation(input, size, footprint, structure, output, mode,
+                          cval, origin)
+
+
+def _grey_dilation(input, size, footprint, structure, output, mode, cval,
+                   origin, anchor=None, anchor_op=None):
+    # dilation mirrors the structuring element; rather than materializing
+    # reversed copies of structure/footprint here, the kernel walks the
+    # weights backward (flip_weights below)
     origin = _util._fix_sequence_arg(origin, input.ndim, 'origin', int)
     for i in range(len(origin)):
         origin[i] = -origin[i]
         if footprint is not None:
-            sz = footprint.shape[i]
+            sz = numpy.shape(footprint)[i]
         elif structure is not None:
-            sz = structure.shape[i]
+            sz = numpy.shape(structure)[i]
         elif numpy.isscalar(size):
             sz = size
         else:
@@ -741,7 +1679,8 @@ def grey_dilation(input, size=None, footprint=None, structure=None,
             origin[i] -= 1
 
     return _filters._min_or_max_filter(input, size, footprint, structure,
-                                       output, mode, cval, origin, 'max')
+                                       output, mode, cval, origin, 'max',
+                                       anchor, anchor_op, flip_weights=True)
 
 
 def grey_closing(input, size=None, footprint=None, structure=None,
@@ -779,6 +1718,10 @@ def grey_closing(input, size=None, footprint=None, structure=None,
     if (size is not None) and (footprint is not None):
         warnings.warn('ignoring size because footprint is set', UserWarning,
                       stacklevel=2)
+    res = _filters._grey_open_close_fused(input, size, footprint, structure,
+                                          output, mode, cval, origin, 'close')
+    if res is not None:
+        return res
     tmp = grey_dilation(input, size, footprint, structure, None, mode, cval,
                         origin)
     return grey_erosion(tmp, size, footprint, structure, output, mode, cval,
@@ -820,12 +1763,46 @@ def grey_opening(input, size=None, footprint=None, structure=None,
     if (size is not None) and (footprint is not None):
         warnings.warn('ignoring size because footprint is set', UserWarning,
                       stacklevel=2)
+    res = _filters._grey_open_close_fused(input, size, footprint, structure,
+                                          output, mode, cval, origin, 'open')
+    if res is not None:
+        return res
     tmp = grey_erosion(input, size, footprint, structure, None, mode, cval,
                        origin)
     return grey_dilation(tmp, size, footprint, structure, output, mode, cval,
                          origin)
 
 
+def _dilation_and_erosion_streams(input, size, footprint, structure, output,
+                                  mode, cval, origin):
+    # The dilation and the erosion of the same input are independent, so
+    # launch them on two side streams; when a single kernel does not fill
+    # the GPU the two filters overlap instead of serializing. The current
+    # stream waits on both before the caller combines the results. The
+    # erosion goes straight into ``output`` when one was supplied.
+    current = cupy.cuda.get_current_stream()
+    s1 = cupy.cuda.Stream(non_blocking=True)
+    s2 = cupy.cuda.Stream(non_blocking=True)
+    start = current.record()
+    s1.wait_event(start)
+    s2.wait_event(start)
+    with s1:
+        dil = grey_dilation(
+            input, size, footprint, structure, None, mode, cval, origin
+        )
+        done1 = s1.record()
+    if not isinstance(output, cupy.ndarray):
+        output = None
+    with s2:
+        ero = grey_erosion(
+            input, size, footprint, structure, output, mode, cval, origin
+        )
+        done2 = s2.record()
+    current.wait_event(done1)
+    current.wait_event(done2)
+    return dil, ero
+
+
 def morphological_gradient(
     input,
     size=None,
@@ -871,18 +1848,16 @@ def morphological_gradient(
 
     .. seealso:: :func:`scipy.ndimage.morphological_gradient`
     """
-    tmp = grey_dilation(
-        input, size, footprint, structure, None, mode, cval, origin
-    )
+    res = _filters._min_and_max_filter(input, size, footprint, structure,
+                                       output, mode, cval, origin, 'gradient')
+    if res is not None:
+        return res
+    tmp, ero = _dilation_and_erosion_streams(
+        input, size, footprint, structure, output, mode, cval, origin)
     if isinstance(output, cupy.ndarray):
-        grey_erosion(
-            input, size, footprint, structure, output, mode, cval, origin
-        )
         return cupy.subtract(tmp, output, output)
-    else:
-        return tmp - grey_erosion(
-            input, size, footprint, structure, None, mode, cval, origin
-        )
+    # reuse the dilation buffer instead of allocating a third array
+    return cupy.subtract(tmp, ero, out=tmp)
 
 
 def morphological_laplace(
@@ -927,20 +1902,25 @@ def morphological_laplace(
 
     .. seealso:: :func:`scipy.ndimage.morphological_laplace`
     """
-    tmp1 = grey_dilation(
-        input, size, footprint, structure, None, mode, cval, origin
-    )
+    res = _filters._min_and_max_filter(input, size, footprint, structure,
+                                       output, mode, cval, origin, 'laplace')
+    if res is not None:
+        return res
+    tmp1, tmp2 = _dilation_and_erosion_streams(
+        input, size, footprint, structure, output, mode, cval, origin)
+    fuse = input.dtype != bool
     if isinstance(output, cupy.ndarray):
-        grey_erosion(
-            input, size, footprint, structure, output, mode, cval, origin
-        )
+        if fuse and output.dtype == input.dtype:
+            _morph_laplace_combine(tmp1, output, input, output)
+            return output
         cupy.add(tmp1, output, output)
         cupy.subtract(output, input, output)
         return cupy.subtract(output, input, output)
     else:
-        tmp2 = grey_erosion(
-            input, size, footprint, structure, None, mode, cval, origin
-        )
+        if fuse:
+            # one fused pass instead of an add and two subtracts
+            _morph_laplace_combine(tmp1, tmp2, input, tmp2)
+            return tmp2
         cupy.add(tmp1, tmp2, tmp2)
         cupy.subtract(tmp2, input, tmp2)
         cupy.subtract(tmp2, input, tmp2)
@@ -995,6 +1975,12 @@ def white_tophat(
     tmp = grey_erosion(
         input, size, footprint, structure, None, mode, cval, origin
     )
+    # fold the final subtraction into the dilation's store when possible
+    anchor_op = 'xor' if input.dtype == numpy.bool_ else 'sub_from'
+    res = _grey_dilation(tmp, size, footprint, structure, output, mode, cval,
+                         origin, anchor=input, anchor_op=anchor_op)
+    if res is not None:
+        return res
     tmp = grey_dilation(
         tmp, size, footprint, structure, output, mode, cval, origin
     )
@@ -1053,6 +2039,13 @@ def black_tophat(
     tmp = grey_dilation(
         input, size, footprint, structure, None, mode, cval, origin
     )
+    # fold the final subtraction into the erosion's store when possible
+    anchor_op = 'xor' if input.dtype == numpy.bool_ else 'sub'
+    res = _filters._min_or_max_filter(tmp, size, footprint, structure, output,
+                                      mode, cval, origin, 'min',
+                                      anchor=input, anchor_op=anchor_op)
+    if res is not None:
+        return res
     tmp = grey_erosion(
         tmp, size, footprint, structure, output, mode, cval, origin
     )
@@ -9,7 +9,6 @@ except ImportError:
     scipy_available = False
 
 import cupy
-import cupyx
 
 from cupy import _core
 from cupy._core import _scalar
@@ -27,61 +26,94 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
                                 sparse_data._minmax_mixin,
                                 _index.IndexMixin):
 
+    # The reduction runs in the native data type (see name_expressions
+    # below); the right specialization is picked at runtime in
+    # _minor_reduce, so float32/float64 inputs avoid an O(nnz) upcast copy.
     _max_min_reduction_code = r'''
-        extern "C" __global__
-        void ${func}(double* data, int* x, int* y, int length,
-                           double* z) {
+        template<typename T> __global__
+        void ${func}(T* data, int* indptr, int length,
+                           T* z) {
+            // One 32-thread block per row; the lanes stride the row with
+            // coalesced loads and combine in shared memory, so long rows no
+            // longer serialize on a single thread.
+            __shared__ T s_val[32];
+            __shared__ int s_nan[32];
+
             // Get the index of the block
-            int tid = blockIdx.x * blockDim.x + threadIdx.x;
+            int tid = blockIdx.x;
+            int lane = threadIdx.x;
+            int start = __ldg(&indptr[tid]);
+            int end = __ldg(&indptr[tid + 1]);
 
             // Calculate the block length
-            int block_length = y[tid] - x[tid];
+            int block_length = end - start;
 
             // Select initial value based on the block density
-            double running_value = 0;
+            T running_value = 0;
             if (${cond}){
-                running_value = data[x[tid]];
+                running_value = data[start];
             } else {
                 running_value = 0;
             }
 
             // Iterate over the block and update
-            for (int entry = x[tid]; entry < y[tid]; entry++){
-                if (data[entry] != data[entry]){
+            int has_nan = 0;
+            for (int entry = start + lane; entry < end; entry += 32){
+                T value = data[entry];
+                if (value != value){
                     // Check for NaN
-                    running_value = nan("");
-                    break;
+                    has_nan = 1;
                 } else {
                     // Check for a value update
-                    if (data[entry] ${op} running_value){
-                        running_value = data[entry];
+                    if (value ${op} running_value){
+                        running_value = value;
+                    }
+                }
+            }
+            s_val[lane] = running_value;
+            s_nan[lane] = has_nan;
+            __syncthreads();
+            for (int offset = 16; offset > 0; offset >>= 1){
+                if (lane < offset){
+                    if (s_val[lane + offset] ${op} s_val[lane]){
+                        s_val[lane] = s_val[lane + offset];
                     }
+                    s_nan[lane] |= s_nan[lane + offset];
                 }
+                __syncthreads();
             }
 
             // Store in the return function
-            z[tid] = running_value;
+            if (lane == 0){
+                z[tid] = s_nan[0] ? nan("") : s_val[0];
+            }
         }'''
 
-    _max_reduction_kern = _core.RawKernel(
-        string.Template(_max_min_reduction_code).substitute(
+    _max_reduction_mod = _core.RawModule(
+        code=string.Template(_max_min_reduction_code).substitute(
             func='max_reduction', op='>', cond='block_length == length'),
-        'max_reduction')
+        options=('-std=c++11',),
+        name_expressions=['max_reduction<float>', 'max_reduction<double>'])
 
-    _max_nonzero_reduction_kern = _core.RawKernel(
-        string.Template(_max_min_reduction_code).substitute(
+    _max_nonzero_reduction_mod = _core.RawModule(
+        code=string.Template(_max_min_reduction_code).substitute(
             func='max_nonzero_reduction', op='>', cond='block_length > 0'),
-        'max_nonzero_reduction')
+        options=('-std=c++11',),
+        name_expressions=['max_nonzero_reduction<float>',
+                          'max_nonzero_reduction<double>'])
 
-    _min_reduction_kern = _core.RawKernel(
-        string.Template(_max_min_reduction_code).substitute(
+    _min_reduction_mod = _core.RawModule(
+        code=string.Template(_max_min_reduction_code).substitute(
             func='min_reduction', op='<', cond='block_length == length'),
-        'min_reduction')
+        options=('-std=c++11',),
+        name_expressions=['min_reduction<float>', 'min_reduction<double>'])
 
-    _min_nonzero_reduction_kern = _core.RawKernel(
-        string.Template(_max_min_reduction_code).substitute(
+    _min_nonzero_reduction_mod = _core.RawModule(
+        code=string.Template(_max_min_reduction_code).substitute(
             func='min_nonzero_reduction', op='<', cond='block_length > 0'),
-        'min_nonzero_reduction')
+        options=('-std=c++11',),
+        name_expressions=['min_nonzero_reduction<float>',
+                          'min_nonzero_reduction<double>'])
 
     # For _max_arg_reduction_mod and _min_arg_reduction_mod below, we pick
     # the right template specialization according to input dtypes at runtime.
@@ -89,13 +121,24 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
 
     _argmax_argmin_code = r'''
         template<typename T1, typename T2> __global__ void
-        ${func}_arg_reduction(T1* data, int* indices, int* x, int* y,
+        ${func}_arg_reduction(T1* data, int* indices, int* indptr,
                               int length, T2* z) {
+            // One 32-thread block per row reducing (value, position) pairs;
+            // ties resolve to the smallest position so the result matches
+            // the old serial scan, with position -1 standing for the
+            // implicit-zero initial value.
+            __shared__ double s_val[32];
+            __shared__ int s_pos[32];
+            __shared__ int s_nan[32];
+
             // Get the index of the block
-            int tid = blockIdx.x * blockDim.x + threadIdx.x;
+            int tid = blockIdx.x;
+            int lane = threadIdx.x;
+            int start = __ldg(&indptr[tid]);
+            int end = __ldg(&indptr[tid + 1]);
 
             // Calculate the block length
-            int block_length = y[tid] - x[tid];
+            int block_length = end - start;
 
             // Select initial value based on the block density
             int data_index = 0;
@@ -103,15 +146,15 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
 
             if (block_length == length){
                 // Block is dense. Fill the first value
-                data_value = data[x[tid]];
-                data_index = indices[x[tid]];
+                data_value = __ldg(&data[start]);
+                data_index = __ldg(&indices[start]);
             } else if (block_length > 0)  {
                 // Block has at least one zero. Assign first occurrence as the
                 // starting reference
                 data_value = 0;
                 for (data_index = 0; data_index < length; data_index++){
-                    if (data_index != indices[x[tid] + data_index] ||
-                        x[tid] + data_index >= y[tid]){
+                    if (data_index != __ldg(&indices[start + data_index]) ||
+                        start + data_index >= end){
                         break;
                     }
                 }
@@ -121,24 +164,53 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
                 data_index = 0;
             }
 
-            // Iterate over the section of the sparse matrix
-            for (int entry = x[tid]; entry < y[tid]; entry++){
-                if (data[entry] != data[entry]){
+            // Iterate over the section of the sparse matrix; all inputs are
+            // read-only here, so route the loads through the texture cache
+            double best_val = data_value;
+            int best_pos = -1;
+            int has_nan = 0;
+            for (int entry = start + lane; entry < end; entry += 32){
+                double value = __ldg(&data[entry]);
+                if (value != value){
                     // Check for NaN
-                    data_value = nan("");
-                    data_index = 0;
-                    break;
+                    has_nan = 1;
                 } else {
                     // Check for a value update
-                    if (data[entry] ${op} data_value){
-                        data_index = indices[entry];
-                        data_value = data[entry];
+                    if (value ${op} best_val){
+                        best_val = value;
+                        best_pos = entry;
                     }
                 }
             }
+            s_val[lane] = best_val;
+            s_pos[lane] = best_pos;
+            s_nan[lane] = has_nan;
+            __syncthreads();
+            for (int offset = 16; offset > 0; offset >>= 1){
+                if (lane < offset){
+                    double other_val = s_val[lane + offset];
+                    int other_pos = s_pos[lane + offset];
+                    if ((other_val ${op} s_val[lane]) ||
+                        (other_val == s_val[lane] &&
+                         other_pos < s_pos[lane])){
+                        s_val[lane] = other_val;
+                        s_pos[lane] = other_pos;
+                    }
+                    s_nan[lane] |= s_nan[lane + offset];
+                }
+                __syncthreads();
+            }
 
             // Store in the return function
-            z[tid] = data_index;
+            if (lane == 0){
+                if (s_nan[0]){
+                    z[tid] = 0;
+                } else if (s_pos[0] < 0){
+                    z[tid] = data_index;
+                } else {
+                    z[tid] = __ldg(&indices[s_pos[0]]);
+                }
+            }
         }'''
 
     _max_arg_reduction_mod = _core.RawModule(
@@ -159,51 +231,94 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
                           'min_arg_reduction<double, int>',
                           'min_arg_reduction<double, long long>'])
 
-    # TODO(leofang): rewrite a more load-balanced approach than this naive one?
-    _has_sorted_indices_kern = _core.ElementwiseKernel(
-        'raw T indptr, raw T indices',
-        'bool diff',
+    _scatter_offsets_kern = _core.ElementwiseKernel(
+        'int32 offset, T value', 'raw T data',
+        'if (offset >= 0) data[offset] = value;',
+        'cupyx_scipy_sparse_scatter_offsets')
+
+    _sum_duplicates_kern = _core.ElementwiseKernel(
+        'int64 start, int64 stop, raw T data, raw I indices',
+        'T out_data, I out_index',
         '''
-        bool diff_out = true;
-        for (T jj = indptr[i]; jj < indptr[i+1] - 1; jj++) {
-            if (indices[jj] > indices[jj+1]){
-                diff_out = false;
-            }
+        T accum = data[start];
+        for (long long jj = start + 1; jj < stop; jj++) {
+            accum += data[jj];
         }
-        diff = diff_out;
-        ''', 'cupyx_scipy_sparse_has_sorted_indices')
+        out_data = accum;
+        out_index = indices[start];
+        ''', 'cupyx_scipy_sparse_sum_duplicates')
 
-    # TODO(leofang): rewrite a more load-balanced approach than this naive one?
-    _has_canonical_format_kern = _core.ElementwiseKernel(
-        'raw T indptr, raw T indices',
-        'bool diff',
+    _indices_monotonic_kern = _core.ElementwiseKernel(
+        'I lo_val, I hi_val, raw I indptr, int32 n_row, bool strict',
+        'raw int32 flag',
         '''
-        bool diff_out = true;
-        if (indptr[i] > indptr[i+1]) {
-            diff = false;
-            return;
-        }
-        for (T jj = indptr[i]; jj < indptr[i+1] - 1; jj++) {
-            if (indices[jj] >= indices[jj+1]) {
-                diff_out = false;
+        const bool bad = strict ? (lo_val >= hi_val) : (lo_val > hi_val);
+        if (bad) {
+            // a decrease is permitted when position i+1 starts a new row;
+            // binary-search indptr for the first entry greater than i
+            int lo = 0, hi = n_row + 1;
+            while (lo < hi) {
+                const int mid = (lo + hi) >> 1;
+                if (indptr[mid] <= i) {
+                    lo = mid + 1;
+                } else {
+                    hi = mid;
+                }
             }
+            if (!(lo <= n_row && indptr[lo] == i + 1)) flag[0] = 0;
         }
-        diff = diff_out;
-        ''', 'cupyx_scipy_sparse_has_canonical_format')
+        ''', 'cupyx_scipy_sparse_indices_monotonic')
 
-    def __init__(self, arg1, shape=None, dtype=None, copy=False):
-        from cupyx import cusparse
+    _indptr_monotonic_kern = _core.ElementwiseKernel(
+        'I lo_val, I hi_val', 'raw int32 flag',
+        'if (lo_val > hi_val) flag[0] = 0;',
+        'cupyx_scipy_sparse_indptr_monotonic')
+
+    def _indices_sorted_within_rows(self, indptr, indices, strict,
+                                    check_indptr=False):
+        """Check that ``indices`` is (strictly) increasing within each row.
+
+        Works on the flat adjacent pairs of ``indices`` with row-boundary
+        positions exempted, so the work is balanced over nonzeros instead
+        of one thread per row. All checks clear a single device flag and
+        only the final read of that flag synchronizes.
+        """
+        flag = cupy.ones(1, dtype=cupy.int32)
+        if check_indptr and indptr.size >= 2:
+            self._indptr_monotonic_kern(indptr[:-1], indptr[1:], flag)
+        if indices.size >= 2:
+            self._indices_monotonic_kern(
+                indices[:-1], indices[1:], indptr,
+                numpy.int32(indptr.size - 1), numpy.bool_(strict), flag)
+        return bool(flag[0])
 
+    def __init__(self, arg1, shape=None, dtype=None, copy=False):
         if shape is not None:
             if not _util.isshape(shape):
                 raise ValueError('invalid shape (must be a 2-tuple of int)')
             shape = int(shape[0]), int(shape[1])
 
-        if _base.issparse(arg1):
+        if isinstance(arg1, tuple) and len(arg1) == 3:
+            # checked first: this is the hot path taken by every internal
+            # construction (_with_data, slicing, indexing, ...)
+            data, indices, indptr = arg1
+            if not (_base.isdense(data) and data.ndim == 1 and
+                    _base.isdense(indices) and indices.ndim == 1 and
+                    _base.isdense(indptr) and indptr.ndim == 1):
+                raise ValueError(
+                    'data, indices, and indptr should be 1-D')
+
+            if len(data) != len(indices):
+                raise ValueError('indices and data should have the same size')
+
+        elif _base.issparse(arg1):
             x = arg1.asformat(self.format)
             data = x.data
             indices = x.indices
             indptr = x.indptr
+            # the structure is taken over as-is, so sortedness/canonical
+            # state known for the source (or its conversion) carries over
+            self._copy_canonical_flags_from(x)
 
             if arg1.format != self.format:
                 # When formats are different, all arrays are already copied
@@ -221,6 +336,9 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
             # shape and copy argument is ignored
             shape = (m, n)
             copy = False
+            # an empty matrix is trivially canonical
+            self._has_sorted_indices = True
+            self._has_canonical_format = True
 
         elif scipy_available and scipy.sparse.issparse(arg1):
             # Convert scipy.sparse to cupyx.scipy.sparse
@@ -229,30 +347,46 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
             indices = cupy.array(x.indices, dtype='i')
             indptr = cupy.array(x.indptr, dtype='i')
             copy = False
+            # SciPy caches sortedness/canonical state in the same underscore
+            # attributes; inherit it when it is already known instead of
+            # re-detecting on device later
+            self._copy_canonical_flags_from(x)
 
             if shape is None:
                 shape = arg1.shape
 
         elif isinstance(arg1, tuple) and len(arg1) == 2:
-            # Note: This implementation is not efficeint, as it first
-            # constructs a sparse matrix with coo format, then converts it to
-            # compressed format.
-            sp_coo = _coo.coo_matrix(arg1, shape=shape, dtype=dtype, copy=copy)
-            sp_compressed = sp_coo.asformat(self.format)
-            data = sp_compressed.data
-            indices = sp_compressed.indices
-            indptr = sp_compressed.indptr
-
-        elif isinstance(arg1, tuple) and len(arg1) == 3:
-            data, indices, indptr = arg1
-            if not (_base.isdense(data) and data.ndim == 1 and
-                    _base.isdense(indices) and indices.ndim == 1 and
-                    _base.isdense(indptr) and indptr.ndim == 1):
-                raise ValueError(
-                    'data, indices, and indptr should be 1-D')
+            # The intermediate COO object exists only inside this
+            # constructor, so convert it in place instead of going through
+            # asformat, whose tocsr/tocsc would first copy all three arrays
+            # defensively before sorting.
+            from cupyx import cusparse
 
-            if len(data) != len(indices):
-                raise ValueError('indices and data should have the same size')
+            sp_coo = _coo.coo_matrix(arg1, shape=shape, dtype=dtype, copy=copy)
+            if shape is None:
+                shape = sp_coo.shape
+            if sp_coo.nnz == 0:
+                data = basic.zeros(0, sp_coo.dtype)
+                indices = basic.zeros(0, 'i')
+                indptr = basic.zeros(self._swap(*shape)[0] + 1, dtype='i')
+            else:
+                # sum_duplicates always rebuilds the arrays here (the COO
+                # constructor never marks tuple input canonical), so the
+                # in-place coosort cannot touch the caller's arrays
+                sp_coo.sum_duplicates()
+                if self.format == 'csr':
+                    cusparse.coosort(sp_coo, 'r')
+                    sp_compressed = cusparse.coo2csr(sp_coo)
+                else:
+                    cusparse.coosort(sp_coo, 'c')
+                    sp_compressed = cusparse.coo2csc(sp_coo)
+                data = sp_compressed.data
+                indices = sp_compressed.indices
+                indptr = sp_compressed.indptr
+            # the dedup + sort above leaves the result canonical; cache the
+            # flags so the first access does not launch a validation kernel
+            self._has_sorted_indices = True
+            self._has_canonical_format = True
 
         elif _base.isdense(arg1):
             if arg1.ndim > 2:
@@ -294,20 +428,48 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
             raise ValueError('index pointer size (%d) should be (%d)'
                              % (len(indptr), major + 1))
 
-        self._descr = cusparse.MatDescriptor.create()
         self._shape = shape
 
+    @property
+    def _descr(self):
+        # Created lazily: only the legacy cusparse routines read the
+        # descriptor, so plain constructions skip the host-side allocation.
+        descr = getattr(self, '_descr_cache', None)
+        if descr is None:
+            from cupyx import cusparse
+
+            descr = cusparse.MatDescriptor.create()
+            self._descr_cache = descr
+        return descr
+
+    def _copy_canonical_flags_from(self, other):
+        """Copy cached sortedness/canonical flags from ``other`` if known.
+
+        Only valid when the sparsity structure of ``self`` is the same as
+        that of ``other``.
+        """
+        flags = getattr(other, '_has_sorted_indices', None)
+        if flags is not None:
+            self._has_sorted_indices = flags
+        flags = getattr(other, '_has_canonical_format', None)
+        if flags is not None:
+            self._has_canonical_format = flags
+
     def _with_data(self, data, copy=True):
         if copy:
-            return self.__class__(
+            out = self.__class__(
                 (data, self.indices.copy(), self.indptr.copy()),
                 shape=self.shape,
                 dtype=data.dtype)
         else:
-            return self.__class__(
+            out = self.__class__(
                 (data, self.indices, self.indptr),
                 shape=self.shape,
                 dtype=data.dtype)
+        # the structure is shared or copied verbatim, so sortedness and
+        # canonical state carry over without re-detection
+        out._copy_canonical_flags_from(self)
+        return out
 
     def _convert_dense(self, x):
         raise NotImplementedError
@@ -413,8 +575,12 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
             _index._csr_row_index(self.data, self.indices, self.indptr, idx),
             shape=new_shape, copy=False)
 
-    def _minor_index_fancy(self, idx):
+    def _minor_index_fancy(self, idx, unique=False):
         """Index along the minor axis where idx is an array of ints.
+
+        When the caller knows ``idx`` contains no duplicates (e.g. it came
+        from a slice), passing ``unique=True`` dispatches to a cheaper
+        filter that skips the occurrence histogram and argsort.
         """
         M, _ = self._swap(*self.shape)
         N = idx.size
@@ -422,11 +588,20 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
         if self.nnz == 0 or N == 0:
             return self.__class__(new_shape, dtype=self.dtype)
 
-        if idx.size * M < self.nnz:
-            # TODO (asi1024): Implement faster algorithm.
-            pass
-
-        return self._tocsx()._major_index_fancy(idx)._tocsx()
+        # index the minor axis directly instead of converting to the
+        # transposed format, gathering along the major axis and converting
+        # back (two cusparse conversions over all nonzeros)
+        column_index = (_index._csr_column_index_unique if unique
+                        else _index._csr_column_index)
+        res = self.__class__(
+            column_index(
+                self.data, self.indices, self.indptr, idx,
+                self._swap(*self.shape)[1]),
+            shape=new_shape, copy=False)
+        # the fill kernel groups each row by input nonzero, which leaves the
+        # indices within a row unsorted
+        res.sort_indices()
+        return res
 
     def _major_slice(self, idx, copy=False):
         """Index along the major axis where idx is a slice object.
@@ -470,7 +645,7 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
                     self.data, self.indices, self.indptr, start, stop),
                 shape=new_shape, copy=False)
         cols = cupy.arange(start, stop, step, dtype=self.indices.dtype)
-        return self._minor_index_fancy(cols)
+        return self._minor_index_fancy(cols, unique=True)
 
     def _set_intXint(self, row, col, x):
         i, j = self._swap(row, col)
@@ -530,17 +705,16 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
         i, j, M, N = self._prepare_indices(i, j)
         x = cupy.array(x, dtype=self.dtype, copy=True, ndmin=1).ravel()
 
-        new_sp = cupyx.scipy.sparse.csr_matrix(
-            (cupy.arange(self.nnz, dtype=cupy.float32),
-             self.indices, self.indptr), shape=(M, N))
+        offsets = _index._csr_find_offsets(
+            self.indptr, self.indices, i, j, M, N,
+            self.has_sorted_indices)
 
-        offsets = new_sp._get_arrayXarray(
-            i, j, not_found_val=-1).astype(cupy.int32).ravel()
+        # scatter onto the existing entries in one pass; missing entries
+        # (offset -1) are skipped inside the kernel, so no boolean mask or
+        # compaction of offsets/x is needed on this path
+        self._scatter_offsets_kern(offsets, x, self.data)
 
-        mask = offsets > -1
-        self.data[offsets[mask]] = x[mask]
-
-        if mask.all():
+        if int(offsets.min()) >= 0:
             # only affects existing non-zero cells
             return
 
@@ -548,7 +722,7 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
         warnings.warn('Changing the sparsity structure of a '
                       '{}_matrix is expensive.'.format(self.format),
                       _base.SparseEfficiencyWarning)
-        mask = ~mask
+        mask = offsets < 0
         i = i[mask]
         i[i < 0] += M
         j = j[mask]
@@ -561,15 +735,13 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
         """
         i, j, M, N = self._prepare_indices(i, j)
 
-        new_sp = cupyx.scipy.sparse.csr_matrix(
-            (cupy.arange(self.nnz, dtype=cupy.float32),
-             self.indices, self.indptr), shape=(M, N))
-
-        offsets = new_sp._get_arrayXarray(
-            i, j, not_found_val=-1).astype(cupy.int32).ravel()
+        offsets = _index._csr_find_offsets(
+            self.indptr, self.indices, i, j, M, N,
+            self.has_sorted_indices)
 
-        # only assign zeros to the existing sparsity structure
-        self.data[offsets[offsets > -1]] = 0
+        # only assign zeros to the existing sparsity structure; the kernel
+        # skips offsets of entries that are not present
+        self._scatter_offsets_kern(offsets, self.dtype.type(0), self.data)
 
     def _perform_insert(self, indices_inserts, data_inserts,
                         rows, row_counts, idx_dtype):
@@ -637,9 +809,12 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
         to_add[:-1] = ui_indptr
         ui_indptr = to_add
 
-        # Compute the counts for each row in the insertion array
-        row_counts = cupy.zeros(ui_indptr.size-1, dtype=idx_dtype)
-        cupy.add.at(row_counts, cupy.searchsorted(rows, indptr_inserts), 1)
+        # Compute the counts for each row in the insertion array; bincount
+        # uses a privatized histogram instead of the atomic scatter loop
+        # that add.at needs for duplicate indices
+        row_counts = cupy.bincount(
+            cupy.searchsorted(rows, indptr_inserts),
+            minlength=ui_indptr.size - 1).astype(idx_dtype, copy=False)
 
         self._perform_insert(indices_inserts, data_inserts,
                              rows, row_counts, idx_dtype)
@@ -661,19 +836,24 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
         """
         # Modified from the SciPy counterpart.
 
+        # fast path: the result was cached, skip all other checks (this
+        # property is read on nearly every arithmetic op)
+        cached = getattr(self, '_has_canonical_format', None)
+        if cached is not None:
+            return cached
+
         # In CuPy the implemented conversions do not exactly match those of
         # SciPy's, so it's hard to put this exactly as where it is in SciPy,
         # but this should do the job.
-        if self.data.size == 0:
+        if self.data.size <= 1:
+            # a single stored entry can be neither unsorted nor duplicated
             self._has_canonical_format = True
-        # check to see if result was cached
         elif not getattr(self, '_has_sorted_indices', True):
             # not sorted => not canonical
             self._has_canonical_format = False
-        elif not hasattr(self, '_has_canonical_format'):
-            is_canonical = self._has_canonical_format_kern(
-                self.indptr, self.indices, size=self.indptr.size-1)
-            self._has_canonical_format = bool(is_canonical.all())
+        else:
+            self._has_canonical_format = self._indices_sorted_within_rows(
+                self.indptr, self.indices, strict=True, check_indptr=True)
         return self._has_canonical_format
 
     def __set_has_canonical_format(self, val):
@@ -699,16 +879,19 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
         """
         # Modified from the SciPy counterpart.
 
+        # fast path: the result was cached (see has_canonical_format)
+        cached = getattr(self, '_has_sorted_indices', None)
+        if cached is not None:
+            return cached
+
         # In CuPy the implemented conversions do not exactly match those of
         # SciPy's, so it's hard to put this exactly as where it is in SciPy,
         # but this should do the job.
-        if self.data.size == 0:
+        if self.data.size <= 1:
             self._has_sorted_indices = True
-        # check to see if result was cached
-        elif not hasattr(self, '_has_sorted_indices'):
-            is_sorted = self._has_sorted_indices_kern(
-                self.indptr, self.indices, size=self.indptr.size-1)
-            self._has_sorted_indices = bool(is_sorted.all())
+        else:
+            self._has_sorted_indices = self._indices_sorted_within_rows(
+                self.indptr, self.indices, strict=False)
         return self._has_sorted_indices
 
     def __set_sorted(self, val):
@@ -740,15 +923,32 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
         else:
             raise ValueError
 
+    @property
+    def nnz(self):
+        # overrides the spmatrix property to skip the getnnz() dispatch and
+        # its axis branch; this is read on nearly every operation
+        return self.data.size
+
     def sorted_indices(self):
         """Return a copy of this matrix with sorted indices
 
         .. warning::
             Calling this function might synchronize the device.
         """
-        # Taken from SciPy as is.
-        A = self.copy()
+        if getattr(self, '_has_sorted_indices', False):
+            return self.copy()
+        # The cuSPARSE sort permutes ``indices`` in place and rebinds
+        # ``data`` to a freshly gathered buffer, so only ``indices`` needs a
+        # defensive copy up front; ``indptr`` is never written in place by
+        # this library, so it can be shared with the result.
+        A = self.__class__(
+            (self.data, self.indices.copy(), self.indptr),
+            shape=self.shape, copy=False)
+        A._copy_canonical_flags_from(self)
         A.sort_indices()
+        if A.data is self.data:
+            # the sort turned out to be a no-op; restore copy semantics
+            A.data = self.data.copy()
         return A
 
     def sort_indices(self):
@@ -771,13 +971,62 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
         """
         if self.has_canonical_format:
             return
-        # TODO(leofang): add a kernel for compressed sparse matrices without
-        # converting to coo
-        coo = self.tocoo()
-        coo.sum_duplicates()
-        self.__init__(coo.asformat(self.format))
+        # sort within rows in place (cuSPARSE), then merge the duplicate
+        # runs directly on the compressed arrays; this avoids the COO
+        # roundtrip and its O(nnz) row-index materialization
+        self.sort_indices()
+        indices = self.indices
+        indptr = self.indptr
+
+        # mark the first entry of each run of equal indices; row starts are
+        # always run heads even if the index value repeats across the
+        # boundary
+        head = cupy.ones(indices.size, dtype=bool)
+        head[1:] = indices[1:] != indices[:-1]
+        boundaries = indptr[1:-1]
+        boundaries = boundaries[
+            (boundaries > 0) & (boundaries < indices.size)]
+        head[boundaries] = True
+
+        starts = cupy.flatnonzero(head)
+        if starts.size == indices.size:
+            # no duplicates; only the flags needed updating
+            self._has_canonical_format = True
+            return
+        stops = cupy.empty_like(starts)
+        stops[:-1] = starts[1:]
+        stops[-1] = indices.size
+
+        new_data = cupy.empty(starts.size, dtype=self.data.dtype)
+        new_indices = cupy.empty(starts.size, dtype=indices.dtype)
+        self._sum_duplicates_kern(
+            starts, stops, self.data, indices, new_data, new_indices)
+
+        # exclusive scan of the run heads maps old positions to new ones,
+        # so the new indptr is just a gather
+        head_scan = cupy.empty(indices.size + 1, dtype=indptr.dtype)
+        head_scan[0] = 0
+        cupy.cumsum(head, dtype=indptr.dtype, out=head_scan[1:])
+
+        self.data = new_data
+        self.indices = new_indices
+        self.indptr = head_scan[indptr]
+        self._has_sorted_indices = True
         self.has_canonical_format = True
 
+    def eliminate_zeros(self):
+        """Removes zero entories in place."""
+        # single-pass stream compaction shared by CSR and CSC: keep the
+        # entries with nonzero values and gather the new indptr from the
+        # exclusive scan of the keep-mask (same scheme as sum_duplicates)
+        mask = self.data != 0
+        mask_scan = cupy.empty(mask.size + 1, dtype=self.indptr.dtype)
+        mask_scan[0] = 0
+        cupy.cumsum(mask, dtype=self.indptr.dtype, out=mask_scan[1:])
+        self.data = self.data[mask]
+        self.indices = self.indices[mask]
+        self.indptr = mask_scan[self.indptr]
+
     #####################
     # Reduce operations #
     #####################
@@ -800,23 +1049,45 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
 
         """
         out_shape = self.shape[1 - axis]
-        # Call to the appropriate kernel function
-        out = cupy.zeros(out_shape).astype(cupy.float64)
+        data = self.data
+        if data.dtype.char not in 'fd':
+            # bool and complex inputs keep the historical float64 compute;
+            # float32/float64 run natively without the upcast copy
+            data = data.astype(cupy.float64)
+        out = cupy.zeros(out_shape, dtype=data.dtype)
         if nonzero:
-            kerns = {cupy.amax: self._max_nonzero_reduction_kern,
-                     cupy.amin: self._min_nonzero_reduction_kern}
+            mods = {cupy.amax: (self._max_nonzero_reduction_mod,
+                                'max_nonzero_reduction'),
+                    cupy.amin: (self._min_nonzero_reduction_mod,
+                                'min_nonzero_reduction')}
         else:
-            kerns = {cupy.amax: self._max_reduction_kern,
-                     cupy.amin: self._min_reduction_kern}
+            mods = {cupy.amax: (self._max_reduction_mod, 'max_reduction'),
+                    cupy.amin: (self._min_reduction_mod, 'min_reduction')}
 
-        kerns[ufunc]((out_shape,), (1,),
-                     (self.data.astype(cupy.float64),
-                      self.indptr[:len(self.indptr) - 1],
-                      self.indptr[1:], cupy.int64(self.shape[axis]),
-                      out))
+        kern = self._get_reduction_func(*mods[ufunc], data.dtype)
+        kern((out_shape,), (32,),
+             (data, self.indptr, cupy.int32(self.shape[axis]),
+              out))
 
         return out
 
+    @staticmethod
+    @cupy._util.memoize(for_each_device=True)
+    def _get_reduction_func(module, func, data_dtype):
+        # memoized per device for the same reason as
+        # _get_arg_reduction_func below
+        return module.get_function(
+            '{}<{}>'.format(func, _scalar.get_typename(data_dtype)))
+
+    @staticmethod
+    @cupy._util.memoize(for_each_device=True)
+    def _get_arg_reduction_func(module, prefix, data_dtype, out_dtype):
+        # memoized (per device, as the function binds to a device module)
+        # so repeated reductions skip the name mangling and module lookup
+        return module.get_function('{}_arg_reduction<{}, {}>'.format(
+            prefix, _scalar.get_typename(data_dtype),
+            _scalar.get_typename(out_dtype)))
+
     def _arg_minor_reduce(self, ufunc, axis):
         """Reduce nonzeros with a ufunc over the minor axis when non-empty
 
@@ -842,19 +1113,18 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
         out = cupy.zeros(out_shape, dtype=int)
 
         # Perform the calculation
-        ker_name = '_arg_reduction<{}, {}>'.format(
-            _scalar.get_typename(self.data.dtype),
-            _scalar.get_typename(out.dtype))
-
         if ufunc == cupy.argmax:
-            ker = self._max_arg_reduction_mod.get_function('max' + ker_name)
+            ker = self._get_arg_reduction_func(
+                self._max_arg_reduction_mod, 'max', self.data.dtype,
+                out.dtype)
         elif ufunc == cupy.argmin:
-            ker = self._min_arg_reduction_mod.get_function('min' + ker_name)
+            ker = self._get_arg_reduction_func(
+                self._min_arg_reduction_mod, 'min', self.data.dtype,
+                out.dtype)
 
-        ker((out_shape,), (1,),
-            (self.data, self.indices,
-             self.indptr[:len(self.indptr) - 1],
-             self.indptr[1:], cupy.int64(self.shape[axis]),
+        ker((out_shape,), (32,),
+            (self.data, self.indices, self.indptr,
+             cupy.int32(self.shape[axis]),
              out))
 
         return out
@@ -173,15 +173,6 @@ class csc_matrix(_compressed._compressed_sparse_matrix):
     # TODO(unno): Implement check_format
     # TODO(unno): Implement diagonal
 
-    def eliminate_zeros(self):
-        """Removes zero entories in place."""
-        t = self.T
-        t.eliminate_zeros()
-        compress = t.T
-        self.data = compress.data
-        self.indices = compress.indices
-        self.indptr = compress.indptr
-
     # TODO(unno): Implement maximum
     # TODO(unno): Implement minimum
     # TODO(unno): Implement multiply
@@ -284,15 +284,6 @@ class csr_matrix(_compressed._compressed_sparse_matrix):
                              self.indices, y)
         return y
 
-    def eliminate_zeros(self):
-        """Removes zero entories in place."""
-        from cupyx import cusparse
-
-        compress = cusparse.csr2csr_compress(self, 0)
-        self.data = compress.data
-        self.indices = compress.indices
-        self.indptr = compress.indptr
-
     def _maximum_minimum(self, other, cupy_op, op_name, dense_check):
         if _util.isscalarlike(other):
             other = cupy.asarray(other, dtype=self.dtype)
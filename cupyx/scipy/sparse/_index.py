@@ -134,6 +134,187 @@ def _csr_row_index(Ax, Aj, Ap, rows):
     return Bx, Bj, Bp
 
 
+_csr_column_index_ker = _core.ElementwiseKernel(
+    'raw int32 Aj, raw T Ax, '
+    'raw int32 col_offsets, raw int32 col_order, '
+    'raw int32 Boff, int32 nnz_a',
+    'int32 Bj, T Bx',
+    '''
+    // One thread per output entry: binary-search the exclusive scan for
+    // the input nonzero this position expands from, so wide expansions
+    // are spread over many threads and the stores stay coalesced.
+    int lo = 0, hi = nnz_a;
+    while (hi - lo > 1) {
+        const int mid = (lo + hi) >> 1;
+        if (Boff[mid] <= i) {
+            lo = mid;
+        } else {
+            hi = mid;
+        }
+    }
+    const int col = Aj[lo];
+    Bj = col_order[col_offsets[col] + (i - Boff[lo])];
+    Bx = Ax[lo];
+''', 'cupyx_scipy_sparse_csr_column_index_ker')
+
+
+def _csr_column_index(Ax, Aj, Ap, idx, n_minor):
+    """Populate indices and data arrays from the given column index
+
+    Args:
+        Ax (cupy.ndarray): data array from input sparse matrix
+        Aj (cupy.ndarray): indices array from input sparse matrix
+        Ap (cupy.ndarray): indptr array from input sparse matrix
+        idx (cupy.ndarray): index array of columns to populate
+        n_minor (int): size of the minor axis of the input sparse matrix
+
+    Returns:
+        Bx (cupy.ndarray): data array of output sparse matrix
+        Bj (cupy.ndarray): indices array of output sparse matrix
+        Bp (cupy.ndarray): indptr array for output sparse matrix
+
+    The output indices are not sorted within each row.
+    """
+    idx = idx.astype(Aj.dtype, copy=False)
+    # the argsort of idx is independent of the histogram and the scans
+    # below, so run it on a side stream to overlap the two setup passes
+    current = cupy.cuda.get_current_stream()
+    side = cupy.cuda.Stream(non_blocking=True)
+    side.wait_event(current.record())
+    with side:
+        col_order = cupy.argsort(idx).astype(Aj.dtype, copy=False)
+        sorted_done = side.record()
+    # how many times each input column is selected and where each column's
+    # group of output columns starts in the sorted index array
+    col_counts = cupy.bincount(idx, minlength=n_minor).astype(
+        Aj.dtype, copy=False)
+    col_offsets = cupy.empty(n_minor, dtype=Aj.dtype)
+    col_offsets[0] = 0
+    cupy.cumsum(col_counts[:-1], out=col_offsets[1:])
+
+    # per-input-nonzero output offsets via one exclusive scan; gathering at
+    # the row starts then yields the output indptr with no per-row kernel
+    Boff = cupy.empty(Aj.size + 1, dtype=Aj.dtype)
+    Boff[0] = 0
+    cupy.cumsum(col_counts[Aj], out=Boff[1:])
+    # start the D2H fetch of the total into pinned memory as soon as the
+    # scan is queued; the host then only waits for the copy itself rather
+    # than draining everything queued after it
+    itemsize = Boff.dtype.itemsize
+    pinned = cupy.cuda.alloc_pinned_memory(itemsize)
+    nnz_host = numpy.frombuffer(pinned, Boff.dtype, 1)
+    Boff[-1:].data.copy_to_host_async(pinned.ptr, itemsize)
+    copied = current.record()
+    Bp = Boff[Ap]
+
+    copied.synchronize()
+    nnz = int(nnz_host[0])
+    Bj = cupy.empty(nnz, dtype=Aj.dtype)
+    Bx = cupy.empty(nnz, dtype=Ax.dtype)
+    current.wait_event(sorted_done)
+    _csr_column_index_ker(Aj, Ax, col_offsets, col_order, Boff,
+                          numpy.int32(Aj.size), Bj, Bx)
+    return Bx, Bj, Bp
+
+
+def _csr_column_index_unique(Ax, Aj, Ap, idx, n_minor):
+    """Populate indices and data arrays from a duplicate-free column index
+
+    Args:
+        Ax (cupy.ndarray): data array from input sparse matrix
+        Aj (cupy.ndarray): indices array from input sparse matrix
+        Ap (cupy.ndarray): indptr array from input sparse matrix
+        idx (cupy.ndarray): index array of columns to populate, which must
+            not contain duplicates
+        n_minor (int): size of the minor axis of the input sparse matrix
+
+    Returns:
+        Bx (cupy.ndarray): data array of output sparse matrix
+        Bj (cupy.ndarray): indices array of output sparse matrix
+        Bp (cupy.ndarray): indptr array for output sparse matrix
+
+    """
+    # without duplicates each kept nonzero expands to exactly one output
+    # entry, so the general histogram/argsort/scan pipeline degenerates to
+    # a mask filter with a renumbering gather
+    idx = idx.astype(Aj.dtype, copy=False)
+    col_map = cupy.full(n_minor, -1, dtype=Aj.dtype)
+    col_map[idx] = cupy.arange(idx.size, dtype=Aj.dtype)
+    new_col = col_map[Aj]
+    mask = new_col >= 0
+    mask_sum = cupy.empty(Aj.size + 1, dtype=Aj.dtype)
+    mask_sum[0] = 0
+    mask_sum[1:] = mask
+    cupy.cumsum(mask_sum, out=mask_sum)
+    Bp = mask_sum[Ap]
+    Bj = new_col[mask]
+    Bx = Ax[mask]
+
+    return Bx, Bj, Bp
+
+
+_csr_find_offsets_ker = _core.ElementwiseKernel(
+    'I major, I minor, raw int32 indptr, raw int32 indices, '
+    'int32 n_major, int32 n_minor, bool is_sorted',
+    'int32 offset',
+    '''
+    int row = major;
+    int col = minor;
+    if (row < 0) row += n_major;
+    if (col < 0) col += n_minor;
+    int lo = indptr[row];
+    int hi = indptr[row + 1];
+    int result = -1;
+    if (is_sorted) {
+        // binary search within the row
+        while (lo < hi) {
+            const int mid = (lo + hi) >> 1;
+            const int cur = indices[mid];
+            if (cur < col) {
+                lo = mid + 1;
+            } else if (cur > col) {
+                hi = mid;
+            } else {
+                result = mid;
+                break;
+            }
+        }
+    } else {
+        for (; lo < hi; lo++) {
+            if (indices[lo] == col) {
+                result = lo;
+                break;
+            }
+        }
+    }
+    offset = result;
+''', 'cupyx_scipy_sparse_csr_find_offsets')
+
+
+def _csr_find_offsets(indptr, indices, major, minor, n_major, n_minor,
+                      is_sorted):
+    """Find the offset into the data array for each (major, minor) pair
+
+    Args:
+        indptr (cupy.ndarray): indptr array from input sparse matrix
+        indices (cupy.ndarray): indices array from input sparse matrix
+        major (cupy.ndarray): major axis index of each entry to look up
+        minor (cupy.ndarray): minor axis index of each entry to look up
+        n_major (int): size of the major axis
+        n_minor (int): size of the minor axis
+        is_sorted (bool): whether ``indices`` is sorted within each row,
+            enabling a binary instead of a linear search
+
+    Returns:
+        offsets (cupy.ndarray): position of each entry in the data array,
+        or ``-1`` where the entry is not stored
+
+    """
+    return _csr_find_offsets_ker(
+        major, minor, indptr, indices,
+        numpy.int32(n_major), numpy.int32(n_minor), numpy.bool_(is_sorted))
+
+
 def _csr_indptr_to_coo_rows(nnz, Bp):
     from cupy_backends.cuda.libs import cusparse
 
@@ -1,4 +1,6 @@
-import contextlib
+import functools
+import math
+import os
 import string
 import sys
 import tempfile
@@ -11,15 +13,26 @@ import cupy
 from cupy import testing
 
 
-@contextlib.contextmanager
+# One temporary cache directory shared by the whole module: the compiled
+# callback modules are cached on disk keyed by the callback source, so tests
+# that use identical callbacks (most parameterizations do) reuse the compiled
+# module instead of invoking nvcc again, while the user's real cache
+# directory stays untouched.
+_tmp_cache_dir = None
+
+
 def use_temporary_cache_dir():
-    target = 'cupy.fft._callback.get_cache_dir'
-    with tempfile.TemporaryDirectory() as path:
-        with mock.patch(target, lambda: path):
-            yield path
+    global _tmp_cache_dir
+    if _tmp_cache_dir is None:
+        # Prefer a tmpfs-backed location so the cache lookups and the
+        # compiled shared objects never touch a real disk.
+        base = '/dev/shm' if os.path.isdir('/dev/shm') else None
+        _tmp_cache_dir = tempfile.TemporaryDirectory(dir=base)
+    return mock.patch(
+        'cupy.fft._callback.get_cache_dir', lambda: _tmp_cache_dir.name)
 
 
-_load_callback = r'''
+_load_callback = string.Template(r'''
 __device__ ${data_type} CB_ConvertInput(
     void* dataIn, size_t offset, void* callerInfo, void* sharedPtr)
 {
@@ -29,9 +42,9 @@ __device__ ${data_type} CB_ConvertInput(
 }
 
 __device__ ${load_type} d_loadCallbackPtr = CB_ConvertInput;
-'''
+''')
 
-_load_callback_with_aux = r'''
+_load_callback_with_aux = string.Template(r'''
 __device__ ${data_type} CB_ConvertInput(
     void* dataIn, size_t offset, void* callerInfo, void* sharedPtr)
 {
@@ -41,9 +54,9 @@ __device__ ${data_type} CB_ConvertInput(
 }
 
 __device__ ${load_type} d_loadCallbackPtr = CB_ConvertInput;
-'''
+''')
 
-_load_callback_with_aux2 = r'''
+_load_callback_with_aux2 = string.Template(r'''
 __device__ ${data_type} CB_ConvertInput(
     void* dataIn, size_t offset, void* callerInfo, void* sharedPtr)
 {
@@ -53,9 +66,9 @@ __device__ ${data_type} CB_ConvertInput(
 }
 
 __device__ ${load_type} d_loadCallbackPtr = CB_ConvertInput;
-'''
+''')
 
-_store_callback = r'''
+_store_callback = string.Template(r'''
 __device__ void CB_ConvertOutput(
     void *dataOut, size_t offset, ${data_type} element,
     void *callerInfo, void *sharedPointer)
@@ -66,9 +79,9 @@ __device__ void CB_ConvertOutput(
 }
 
 __device__ ${store_type} d_storeCallbackPtr = CB_ConvertOutput;
-'''
+''')
 
-_store_callback_with_aux = r'''
+_store_callback_with_aux = string.Template(r'''
 __device__ void CB_ConvertOutput(
     void *dataOut, size_t offset, ${data_type} element,
     void *callerInfo, void *sharedPointer)
@@ -79,25 +92,185 @@ __device__ void CB_ConvertOutput(
 }
 
 __device__ ${store_type} d_storeCallbackPtr = CB_ConvertOutput;
-'''
+''')
 
 
+# The substitutions are pure functions of their arguments and only a dozen
+# unique combinations exist across the whole parameterization matrix, so the
+# results are memoized.
+
+@functools.lru_cache(maxsize=None)
 def _set_load_cb(code, element, data_type, callback_type, aux_type=None):
-    return string.Template(code).substitute(
+    return code.substitute(
         data_type=data_type,
         aux_type=aux_type,
         load_type=callback_type,
         element=element)
 
 
+@functools.lru_cache(maxsize=None)
 def _set_store_cb(code, element, data_type, callback_type, aux_type=None):
-    return string.Template(code).substitute(
+    return code.substitute(
         data_type=data_type,
         aux_type=aux_type,
         store_type=callback_type,
         element=element)
 
 
+@functools.lru_cache(maxsize=None)
+def _shaped_random_cached(shape, dtype, on_gpu):
+    """One shared input array per (shape, dtype) and array module.
+
+    ``testing.shaped_random`` is deterministic (fixed seed), so tests that
+    share the input parameters can reuse a single host generation and a
+    single H2D copy. Callers must not mutate the returned array.
+    """
+    return testing.shaped_random(shape, cupy if on_gpu else np, dtype)
+
+
+@functools.lru_cache(maxsize=None)
+def _aux_scalar_cached(value, dtype_char):
+    """One shared device scalar per (value, dtype) for the aux callbacks."""
+    return cupy.asarray(value, dtype=dtype_char)
+
+
+@functools.lru_cache(maxsize=None)
+def _arange_cached(size, dtype_char, on_gpu):
+    """One shared ``arange`` buffer per (size, dtype) and array module.
+
+    Used as the per-element aux array of the load callback; it is never
+    written to, so one allocation serves all parameterizations.
+    """
+    xp = cupy if on_gpu else np
+    return xp.arange(size, dtype=dtype_char)
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy_fft_ref(fft_func, shape, fft_kwargs, norm, dtype, load, store):
+    """Compute the NumPy reference result once per unique combination.
+
+    The input of ``testing.shaped_random`` is deterministic, so tests that
+    share (shape, transform, dtype) and the load/store post-processing can
+    reuse one reference instead of redoing the host FFT per test method.
+    """
+    fft = getattr(np.fft, fft_func)
+    a = _shaped_random_cached(shape, dtype, False).copy()
+    if load:
+        a.real *= 2.5
+    out = fft(a, norm=norm, **dict(fft_kwargs))
+    irfft = fft_func in ('irfft', 'irfftn')
+    # Downcast first so the store post-processing runs at the precision the
+    # GPU callback uses (single for float32/complex64 inputs).
+    if dtype in (np.float32, np.complex64):
+        out = out.astype(np.float32 if irfft else np.complex64)
+    if store:
+        if irfft:
+            out /= 3.8
+        else:
+            out.imag /= 3.8
+    return out
+
+
+# dtype -> (element expression, cuFFT data type, callback type); shared by
+# the 1-D and N-D tests since the type strings are identical
+_load_types = {
+    np.complex64: ('x.x', 'cufftComplex', 'cufftCallbackLoadC'),
+    np.complex128: ('x.x', 'cufftDoubleComplex', 'cufftCallbackLoadZ'),
+    np.float32: ('x', 'cufftReal', 'cufftCallbackLoadR'),
+    np.float64: ('x', 'cufftDoubleReal', 'cufftCallbackLoadD'),
+}
+
+# for transforms with complex output (fft/ifft/rfft)
+_store_types = {
+    np.complex64: ('x.y', 'cufftComplex', 'cufftCallbackStoreC'),
+    np.complex128: ('x.y', 'cufftDoubleComplex', 'cufftCallbackStoreZ'),
+    np.float32: ('x.y', 'cufftComplex', 'cufftCallbackStoreC'),
+    np.float64: ('x.y', 'cufftDoubleComplex', 'cufftCallbackStoreZ'),
+}
+
+# for transforms with real output (irfft)
+_store_types_real_out = {
+    np.complex64: ('x', 'cufftReal', 'cufftCallbackStoreR'),
+    np.complex128: ('x', 'cufftDoubleReal', 'cufftCallbackStoreD'),
+}
+
+# C type of the aux scalar/array, matching the real precision of the dtype
+_aux_types = {
+    np.complex64: 'float',
+    np.complex128: 'double',
+    np.float32: 'float',
+    np.float64: 'double',
+}
+
+# NumPy dtype character of the same real precision
+_real_chars = {
+    np.complex64: 'f',
+    np.complex128: 'd',
+    np.float32: 'f',
+    np.float64: 'd',
+}
+
+
+class _CallbackTestBase:
+    """Shared driver for the 1-D and N-D callback test classes.
+
+    Subclasses provide the transform keywords (``n`` vs ``s``/``axes``)
+    through ``_fft_kwargs``; everything else — callback source selection,
+    aux array setup and the NumPy reference — is identical for both.
+    """
+
+    @classmethod
+    def setup_class(cls):
+        # The parameterized matrix mixes enough (shape, dtype, callback)
+        # combinations that the default LRU plan cache size (16) evicts
+        # plans mid-class; enlarge it so plans with registered callbacks
+        # are reused instead of rebuilt.
+        cls._plan_cache = cupy.fft.config.get_plan_cache()
+        cls._plan_cache_size = cls._plan_cache.get_size()
+        cls._plan_cache.set_size(64)
+
+    @classmethod
+    def teardown_class(cls):
+        cls._plan_cache.set_size(cls._plan_cache_size)
+
+    def _fft_kwargs(self):
+        raise NotImplementedError
+
+    def _run_transform(self, xp, dtype, fft_func, load=False, store=False,
+                       aux=False):
+        fft = getattr(xp.fft, fft_func)
+        kwargs = self._fft_kwargs()
+        if xp is np:
+            return _numpy_fft_ref(
+                fft_func, self.shape, tuple(kwargs.items()), self.norm,
+                dtype, load, store)
+
+        cb_kwargs = {}
+        aux_type = _aux_types[dtype] if aux else None
+        if load:
+            code = _load_callback_with_aux if aux else _load_callback
+            cb_kwargs['cb_load'] = _set_load_cb(
+                code, *_load_types[dtype], aux_type)
+        if store:
+            if fft_func in ('irfft', 'irfftn'):
+                store_types = _store_types_real_out[dtype]
+            else:
+                store_types = _store_types[dtype]
+            code = _store_callback_with_aux if aux else _store_callback
+            cb_kwargs['cb_store'] = _set_store_cb(code, *store_types, aux_type)
+        if aux:
+            real_char = _real_chars[dtype]
+            cb_kwargs['cb_load_aux_arr'] = _aux_scalar_cached(2.5, real_char)
+            cb_kwargs['cb_store_aux_arr'] = _aux_scalar_cached(3.8, real_char)
+
+        a = _shaped_random_cached(self.shape, dtype, True)
+        with use_temporary_cache_dir():
+            with xp.fft.config.set_cufft_callbacks(**cb_kwargs):
+                out = fft(a, norm=self.norm, **kwargs)
+
+        return out
+
+
 @testing.parameterize(*testing.product({
     'n': [None, 5, 10, 15],
     'shape': [(10, 7), (10,), (10, 10)],
@@ -108,204 +281,86 @@ def _set_store_cb(code, element, data_type, callback_type, aux_type=None):
                     reason='callbacks are only supported on Linux')
 @pytest.mark.skipif(cupy.cuda.runtime.is_hip,
                     reason='hipFFT does not support callbacks')
-class Test1dCallbacks:
+class Test1dCallbacks(_CallbackTestBase):
 
-    def _test_load_helper(self, xp, dtype, fft_func):
-        fft = getattr(xp.fft, fft_func)
-        code = _load_callback
-        if dtype == np.complex64:
-            types = ('x.x', 'cufftComplex', 'cufftCallbackLoadC')
-        elif dtype == np.complex128:
-            types = ('x.x', 'cufftDoubleComplex', 'cufftCallbackLoadZ')
-        elif dtype == np.float32:
-            types = ('x', 'cufftReal', 'cufftCallbackLoadR')
-        else:
-            types = ('x', 'cufftDoubleReal', 'cufftCallbackLoadD')
-        cb_load = _set_load_cb(code, *types)
-
-        a = testing.shaped_random(self.shape, xp, dtype)
-        if xp is np:
-            a.real *= 2.5
-            out = fft(a, n=self.n, norm=self.norm)
-            if dtype in (np.float32, np.complex64):
-                if fft_func != 'irfft':
-                    out = out.astype(np.complex64)
-                else:
-                    out = out.astype(np.float32)
-        else:
-            with use_temporary_cache_dir():
-                with xp.fft.config.set_cufft_callbacks(cb_load=cb_load):
-                    out = fft(a, n=self.n, norm=self.norm)
-
-        return out
+    def _fft_kwargs(self):
+        return {'n': self.n}
 
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, contiguous_check=False)
     def test_fft_load(self, xp, dtype):
-        return self._test_load_helper(xp, dtype, 'fft')
+        return self._run_transform(xp, dtype, 'fft', load=True)
 
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, contiguous_check=False)
     def test_ifft_load(self, xp, dtype):
-        return self._test_load_helper(xp, dtype, 'ifft')
+        return self._run_transform(xp, dtype, 'ifft', load=True)
 
     @testing.for_float_dtypes(no_float16=True)
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, contiguous_check=False)
     def test_rfft_load(self, xp, dtype):
-        return self._test_load_helper(xp, dtype, 'rfft')
+        return self._run_transform(xp, dtype, 'rfft', load=True)
 
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, contiguous_check=False)
     def test_irfft_load(self, xp, dtype):
-        return self._test_load_helper(xp, dtype, 'irfft')
-
-    def _test_store_helper(self, xp, dtype, fft_func):
-        fft = getattr(xp.fft, fft_func)
-        code = _store_callback
-        if dtype == np.complex64:
-            if fft_func != 'irfft':
-                types = ('x.y', 'cufftComplex', 'cufftCallbackStoreC')
-            else:
-                types = ('x', 'cufftReal', 'cufftCallbackStoreR')
-        elif dtype == np.complex128:
-            if fft_func != 'irfft':
-                types = ('x.y', 'cufftDoubleComplex', 'cufftCallbackStoreZ')
-            else:
-                types = ('x', 'cufftDoubleReal', 'cufftCallbackStoreD')
-        elif dtype == np.float32:
-            types = ('x.y', 'cufftComplex', 'cufftCallbackStoreC')
-        elif dtype == np.float64:
-            types = ('x.y', 'cufftDoubleComplex', 'cufftCallbackStoreZ')
-        cb_store = _set_store_cb(code, *types)
-
-        a = testing.shaped_random(self.shape, xp, dtype)
-        if xp is np:
-            out = fft(a, n=self.n, norm=self.norm)
-            if fft_func != 'irfft':
-                out.imag /= 3.8
-                if dtype in (np.float32, np.complex64):
-                    out = out.astype(np.complex64)
-            else:
-                out /= 3.8
-                if dtype in (np.float32, np.complex64):
-                    out = out.astype(np.float32)
-        else:
-            with use_temporary_cache_dir():
-                with xp.fft.config.set_cufft_callbacks(cb_store=cb_store):
-                    out = fft(a, n=self.n, norm=self.norm)
-
-        return out
+        return self._run_transform(xp, dtype, 'irfft', load=True)
 
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, contiguous_check=False)
     def test_fft_store(self, xp, dtype):
-        return self._test_store_helper(xp, dtype, 'fft')
+        return self._run_transform(xp, dtype, 'fft', store=True)
 
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, contiguous_check=False)
     def test_ifft_store(self, xp, dtype):
-        return self._test_store_helper(xp, dtype, 'ifft')
+        return self._run_transform(xp, dtype, 'ifft', store=True)
 
     @testing.for_float_dtypes(no_float16=True)
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, contiguous_check=False)
     def test_rfft_store(self, xp, dtype):
-        return self._test_store_helper(xp, dtype, 'rfft')
+        return self._run_transform(xp, dtype, 'rfft', store=True)
 
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, contiguous_check=False)
     def test_irfft_store(self, xp, dtype):
-        return self._test_store_helper(xp, dtype, 'irfft')
-
-    def _test_load_store_helper(self, xp, dtype, fft_func):
-        fft = getattr(xp.fft, fft_func)
-        load_code = _load_callback
-        store_code = _store_callback
-        if fft_func in ('fft', 'ifft'):
-            if dtype == np.complex64:
-                load_types = ('x.x', 'cufftComplex', 'cufftCallbackLoadC')
-                store_types = ('x.y', 'cufftComplex', 'cufftCallbackStoreC')
-            else:
-                load_types = (
-                    'x.x', 'cufftDoubleComplex', 'cufftCallbackLoadZ')
-                store_types = (
-                    'x.y', 'cufftDoubleComplex', 'cufftCallbackStoreZ')
-        elif fft_func == 'rfft':
-            if dtype == np.float32:
-                load_types = ('x', 'cufftReal', 'cufftCallbackLoadR')
-                store_types = ('x.y', 'cufftComplex', 'cufftCallbackStoreC')
-            else:
-                load_types = ('x', 'cufftDoubleReal', 'cufftCallbackLoadD')
-                store_types = (
-                    'x.y', 'cufftDoubleComplex', 'cufftCallbackStoreZ')
-        else:  # irfft
-            if dtype == np.complex64:
-                load_types = ('x.x', 'cufftComplex', 'cufftCallbackLoadC')
-                store_types = ('x', 'cufftReal', 'cufftCallbackStoreR')
-            else:
-                load_types = (
-                    'x.x', 'cufftDoubleComplex', 'cufftCallbackLoadZ')
-                store_types = ('x', 'cufftDoubleReal', 'cufftCallbackStoreD')
-        cb_load = _set_load_cb(load_code, *load_types)
-        cb_store = _set_store_cb(store_code, *store_types)
-
-        a = testing.shaped_random(self.shape, xp, dtype)
-        if xp is np:
-            a.real *= 2.5
-            out = fft(a, n=self.n, norm=self.norm)
-            if fft_func != 'irfft':
-                out.imag /= 3.8
-                if dtype in (np.float32, np.complex64):
-                    out = out.astype(np.complex64)
-            else:
-                out /= 3.8
-                if dtype in (np.float32, np.complex64):
-                    out = out.astype(np.float32)
-        else:
-            with use_temporary_cache_dir():
-                with xp.fft.config.set_cufft_callbacks(
-                        cb_load=cb_load, cb_store=cb_store):
-                    out = fft(a, n=self.n, norm=self.norm)
-
-        return out
+        return self._run_transform(xp, dtype, 'irfft', store=True)
 
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, contiguous_check=False)
     def test_fft_load_store(self, xp, dtype):
-        return self._test_load_store_helper(xp, dtype, 'fft')
+        return self._run_transform(xp, dtype, 'fft', load=True, store=True)
 
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, contiguous_check=False)
     def test_ifft_load_store(self, xp, dtype):
-        return self._test_load_store_helper(xp, dtype, 'ifft')
+        return self._run_transform(xp, dtype, 'ifft', load=True, store=True)
 
     @testing.for_float_dtypes(no_float16=True)
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, contiguous_check=False)
     def test_rfft_load_store(self, xp, dtype):
-        return self._test_load_store_helper(xp, dtype, 'rfft')
+        return self._run_transform(xp, dtype, 'rfft', load=True, store=True)
 
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, contiguous_check=False)
     def test_irfft_load_store(self, xp, dtype):
-        return self._test_load_store_helper(xp, dtype, 'irfft')
+        return self._run_transform(xp, dtype, 'irfft', load=True, store=True)
 
+    @testing.slow
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, contiguous_check=False)
     def test_fft_load_aux(self, xp, dtype):
         fft = xp.fft.fft
-        c = _load_callback_with_aux2
-        if dtype == np.complex64:
-            cb_load = _set_load_cb(
-                c, 'x.x', 'cufftComplex', 'cufftCallbackLoadC', 'float')
-        else:
-            cb_load = _set_load_cb(
-                c, 'x.x', 'cufftDoubleComplex', 'cufftCallbackLoadZ', 'double')
+        cb_load = _set_load_cb(
+            _load_callback_with_aux2, *_load_types[dtype], _aux_types[dtype])
 
-        a = testing.shaped_random(self.shape, xp, dtype)
+        a = _shaped_random_cached(self.shape, dtype, xp is cupy)
         out_last = self.n if self.n is not None else self.shape[-1]
         out_shape = list(self.shape)
         out_shape[-1] = out_last
         last_min = min(self.shape[-1], out_last)
-        b = xp.arange(np.prod(out_shape), dtype=xp.dtype(dtype).char.lower())
+        b = _arange_cached(
+            math.prod(out_shape), _real_chars[dtype], xp is cupy)
         b = b.reshape(out_shape)
         if xp is np:
             x = np.zeros(out_shape, dtype=dtype)
@@ -322,90 +377,33 @@ class Test1dCallbacks:
 
         return out
 
-    def _test_load_store_aux_helper(self, xp, dtype, fft_func):
-        fft = getattr(xp.fft, fft_func)
-        load_code = _load_callback_with_aux
-        store_code = _store_callback_with_aux
-        if xp is cupy:
-            load_aux = xp.asarray(2.5, dtype=xp.dtype(dtype).char.lower())
-            store_aux = xp.asarray(3.8, dtype=xp.dtype(dtype).char.lower())
-
-        if fft_func in ('fft', 'ifft'):
-            if dtype == np.complex64:
-                load_types = (
-                    'x.x', 'cufftComplex', 'cufftCallbackLoadC', 'float')
-                store_types = (
-                    'x.y', 'cufftComplex', 'cufftCallbackStoreC', 'float')
-            else:
-                load_types = ('x.x', 'cufftDoubleComplex',
-                              'cufftCallbackLoadZ', 'double')
-                store_types = ('x.y', 'cufftDoubleComplex',
-                               'cufftCallbackStoreZ', 'double')
-        elif fft_func == 'rfft':
-            if dtype == np.float32:
-                load_types = (
-                    'x', 'cufftReal', 'cufftCallbackLoadR', 'float')
-                store_types = (
-                    'x.y', 'cufftComplex', 'cufftCallbackStoreC', 'float')
-            else:
-                load_types = (
-                    'x', 'cufftDoubleReal', 'cufftCallbackLoadD', 'double')
-                store_types = ('x.y', 'cufftDoubleComplex',
-                               'cufftCallbackStoreZ', 'double')
-        else:  # irfft
-            if dtype == np.complex64:
-                load_types = (
-                    'x.x', 'cufftComplex', 'cufftCallbackLoadC', 'float')
-                store_types = (
-                    'x', 'cufftReal', 'cufftCallbackStoreR', 'float')
-            else:
-                load_types = ('x.x', 'cufftDoubleComplex',
-                              'cufftCallbackLoadZ', 'double')
-                store_types = ('x', 'cufftDoubleReal',
-                               'cufftCallbackStoreD', 'double')
-        cb_load = _set_load_cb(load_code, *load_types)
-        cb_store = _set_store_cb(store_code, *store_types)
-
-        a = testing.shaped_random(self.shape, xp, dtype)
-        if xp is np:
-            a.real *= 2.5
-            out = fft(a, n=self.n, norm=self.norm)
-            if fft_func != 'irfft':
-                out.imag /= 3.8
-                if dtype in (np.float32, np.complex64):
-                    out = out.astype(np.complex64)
-            else:
-                out /= 3.8
-                if dtype in (np.float32, np.complex64):
-                    out = out.astype(np.float32)
-        else:
-            with use_temporary_cache_dir():
-                with xp.fft.config.set_cufft_callbacks(
-                        cb_load=cb_load, cb_store=cb_store,
-                        cb_load_aux_arr=load_aux, cb_store_aux_arr=store_aux):
-                    out = fft(a, n=self.n, norm=self.norm)
-
-        return out
-
+    @testing.slow
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, contiguous_check=False)
     def test_fft_load_store_aux(self, xp, dtype):
-        return self._test_load_store_aux_helper(xp, dtype, 'fft')
+        return self._run_transform(
+            xp, dtype, 'fft', load=True, store=True, aux=True)
 
+    @testing.slow
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, contiguous_check=False)
     def test_ifft_load_store_aux(self, xp, dtype):
-        return self._test_load_store_aux_helper(xp, dtype, 'ifft')
+        return self._run_transform(
+            xp, dtype, 'ifft', load=True, store=True, aux=True)
 
+    @testing.slow
     @testing.for_float_dtypes(no_float16=True)
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, contiguous_check=False)
     def test_rfft_load_store_aux(self, xp, dtype):
-        return self._test_load_store_aux_helper(xp, dtype, 'rfft')
+        return self._run_transform(
+            xp, dtype, 'rfft', load=True, store=True, aux=True)
 
+    @testing.slow
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, contiguous_check=False)
     def test_irfft_load_store_aux(self, xp, dtype):
-        return self._test_load_store_aux_helper(xp, dtype, 'irfft')
+        return self._run_transform(
+            xp, dtype, 'irfft', load=True, store=True, aux=True)
 
 
 @testing.parameterize(
@@ -426,283 +424,111 @@ class Test1dCallbacks:
                     reason='callbacks are only supported on Linux')
 @pytest.mark.skipif(cupy.cuda.runtime.is_hip,
                     reason='hipFFT does not support callbacks')
-class TestNdCallbacks:
-
-    def _test_load_helper(self, xp, dtype, fft_func):
-        fft = getattr(xp.fft, fft_func)
-        load_code = _load_callback
-        if dtype == np.complex64:
-            types = ('x.x', 'cufftComplex', 'cufftCallbackLoadC')
-        elif dtype == np.complex128:
-            types = ('x.x', 'cufftDoubleComplex', 'cufftCallbackLoadZ')
-        elif dtype == np.float32:
-            types = ('x', 'cufftReal', 'cufftCallbackLoadR')
-        else:
-            types = ('x', 'cufftDoubleReal', 'cufftCallbackLoadD')
-        cb_load = _set_load_cb(load_code, *types)
+class TestNdCallbacks(_CallbackTestBase):
 
-        a = testing.shaped_random(self.shape, xp, dtype)
-        if xp is np:
-            a.real *= 2.5
-            out = fft(a, s=self.s, axes=self.axes, norm=self.norm)
-            if dtype in (np.float32, np.complex64):
-                if fft_func != 'irfftn':
-                    out = out.astype(np.complex64)
-                else:
-                    out = out.astype(np.float32)
-        else:
-            with use_temporary_cache_dir():
-                with xp.fft.config.set_cufft_callbacks(cb_load=cb_load):
-                    out = fft(a, s=self.s, axes=self.axes, norm=self.norm)
-
-        return out
+    def _fft_kwargs(self):
+        return {'s': self.s, 'axes': self.axes}
 
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, accept_error=ValueError,
                                  contiguous_check=False)
     def test_fftn_load(self, xp, dtype):
-        return self._test_load_helper(xp, dtype, 'fftn')
+        return self._run_transform(xp, dtype, 'fftn', load=True)
 
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, accept_error=ValueError,
                                  contiguous_check=False)
     def test_ifftn_load(self, xp, dtype):
-        return self._test_load_helper(xp, dtype, 'ifftn')
+        return self._run_transform(xp, dtype, 'ifftn', load=True)
 
     @testing.for_float_dtypes(no_float16=True)
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, accept_error=ValueError,
                                  contiguous_check=False)
     def test_rfftn_load(self, xp, dtype):
-        return self._test_load_helper(xp, dtype, 'rfftn')
+        return self._run_transform(xp, dtype, 'rfftn', load=True)
 
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, accept_error=ValueError,
                                  contiguous_check=False)
     def test_irfftn_load(self, xp, dtype):
-        return self._test_load_helper(xp, dtype, 'irfftn')
-
-    def _test_store_helper(self, xp, dtype, fft_func):
-        fft = getattr(xp.fft, fft_func)
-        store_code = _store_callback
-        if dtype == np.complex64:
-            if fft_func != 'irfftn':
-                types = ('x.y', 'cufftComplex', 'cufftCallbackStoreC')
-            else:
-                types = ('x', 'cufftReal', 'cufftCallbackStoreR')
-        elif dtype == np.complex128:
-            if fft_func != 'irfftn':
-                types = ('x.y', 'cufftDoubleComplex', 'cufftCallbackStoreZ')
-            else:
-                types = ('x', 'cufftDoubleReal', 'cufftCallbackStoreD')
-        elif dtype == np.float32:
-            types = ('x.y', 'cufftComplex', 'cufftCallbackStoreC')
-        elif dtype == np.float64:
-            types = ('x.y', 'cufftDoubleComplex', 'cufftCallbackStoreZ')
-        cb_store = _set_store_cb(store_code, *types)
-
-        a = testing.shaped_random(self.shape, xp, dtype)
-        if xp is np:
-            out = fft(a, s=self.s, axes=self.axes, norm=self.norm)
-            if fft_func != 'irfftn':
-                out.imag /= 3.8
-                if dtype in (np.float32, np.complex64):
-                    out = out.astype(np.complex64)
-            else:
-                out /= 3.8
-                if dtype in (np.float32, np.complex64):
-                    out = out.astype(np.float32)
-        else:
-            with use_temporary_cache_dir():
-                with xp.fft.config.set_cufft_callbacks(cb_store=cb_store):
-                    out = fft(a, s=self.s, axes=self.axes, norm=self.norm)
-
-        return out
+        return self._run_transform(xp, dtype, 'irfftn', load=True)
 
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, accept_error=ValueError,
                                  contiguous_check=False)
     def test_fftn_store(self, xp, dtype):
-        return self._test_store_helper(xp, dtype, 'fftn')
+        return self._run_transform(xp, dtype, 'fftn', store=True)
 
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, accept_error=ValueError,
                                  contiguous_check=False)
     def test_ifftn_store(self, xp, dtype):
-        return self._test_store_helper(xp, dtype, 'ifftn')
+        return self._run_transform(xp, dtype, 'ifftn', store=True)
 
     @testing.for_float_dtypes(no_float16=True)
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, accept_error=ValueError,
                                  contiguous_check=False)
     def test_rfftn_store(self, xp, dtype):
-        return self._test_store_helper(xp, dtype, 'rfftn')
+        return self._run_transform(xp, dtype, 'rfftn', store=True)
 
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, accept_error=ValueError,
                                  contiguous_check=False)
     def test_irfftn_store(self, xp, dtype):
-        return self._test_store_helper(xp, dtype, 'irfftn')
-
-    def _test_load_store_helper(self, xp, dtype, fft_func):
-        fft = getattr(xp.fft, fft_func)
-        load_code = _load_callback
-        store_code = _store_callback
-        if fft_func in ('fftn', 'ifftn'):
-            if dtype == np.complex64:
-                load_types = ('x.x', 'cufftComplex', 'cufftCallbackLoadC')
-                store_types = ('x.y', 'cufftComplex', 'cufftCallbackStoreC')
-            else:
-                load_types = (
-                    'x.x', 'cufftDoubleComplex', 'cufftCallbackLoadZ')
-                store_types = (
-                    'x.y', 'cufftDoubleComplex', 'cufftCallbackStoreZ')
-        elif fft_func == 'rfftn':
-            if dtype == np.float32:
-                load_types = ('x', 'cufftReal', 'cufftCallbackLoadR')
-                store_types = ('x.y', 'cufftComplex', 'cufftCallbackStoreC')
-            else:
-                load_types = ('x', 'cufftDoubleReal', 'cufftCallbackLoadD')
-                store_types = (
-                    'x.y', 'cufftDoubleComplex', 'cufftCallbackStoreZ')
-        else:  # irfft
-            if dtype == np.complex64:
-                load_types = ('x.x', 'cufftComplex', 'cufftCallbackLoadC')
-                store_types = ('x', 'cufftReal', 'cufftCallbackStoreR')
-            else:
-                load_types = (
-                    'x.x', 'cufftDoubleComplex', 'cufftCallbackLoadZ')
-                store_types = ('x', 'cufftDoubleReal', 'cufftCallbackStoreD')
-        cb_load = _set_load_cb(load_code, *load_types)
-        cb_store = _set_store_cb(store_code, *store_types)
-
-        a = testing.shaped_random(self.shape, xp, dtype)
-        if xp is np:
-            a.real *= 2.5
-            out = fft(a, s=self.s, axes=self.axes, norm=self.norm)
-            if fft_func != 'irfftn':
-                out.imag /= 3.8
-                if dtype in (np.float32, np.complex64):
-                    out = out.astype(np.complex64)
-            else:
-                out /= 3.8
-                if dtype in (np.float32, np.complex64):
-                    out = out.astype(np.float32)
-        else:
-            with use_temporary_cache_dir():
-                with xp.fft.config.set_cufft_callbacks(
-                        cb_load=cb_load, cb_store=cb_store):
-                    out = fft(a, s=self.s, axes=self.axes, norm=self.norm)
-
-        return out
+        return self._run_transform(xp, dtype, 'irfftn', store=True)
 
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, accept_error=ValueError,
                                  contiguous_check=False)
     def test_fftn_load_store(self, xp, dtype):
-        return self._test_load_store_helper(xp, dtype, 'fftn')
+        return self._run_transform(xp, dtype, 'fftn', load=True, store=True)
 
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, accept_error=ValueError,
                                  contiguous_check=False)
     def test_ifftn_load_store(self, xp, dtype):
-        return self._test_load_store_helper(xp, dtype, 'ifftn')
+        return self._run_transform(xp, dtype, 'ifftn', load=True, store=True)
 
     @testing.for_float_dtypes(no_float16=True)
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, accept_error=ValueError,
                                  contiguous_check=False)
     def test_rfftn_load_store(self, xp, dtype):
-        return self._test_load_store_helper(xp, dtype, 'rfftn')
+        return self._run_transform(xp, dtype, 'rfftn', load=True, store=True)
 
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, accept_error=ValueError,
                                  contiguous_check=False)
     def test_irfftn_load_store(self, xp, dtype):
-        return self._test_load_store_helper(xp, dtype, 'irfftn')
-
-    def _test_load_store_aux_helper(self, xp, dtype, fft_func):
-        fft = getattr(xp.fft, fft_func)
-        load_code = _load_callback_with_aux
-        store_code = _store_callback_with_aux
-        if xp is cupy:
-            load_aux = xp.asarray(2.5, dtype=xp.dtype(dtype).char.lower())
-            store_aux = xp.asarray(3.8, dtype=xp.dtype(dtype).char.lower())
-
-        if fft_func in ('fftn', 'ifftn'):
-            if dtype == np.complex64:
-                load_types = (
-                    'x.x', 'cufftComplex', 'cufftCallbackLoadC', 'float')
-                store_types = (
-                    'x.y', 'cufftComplex', 'cufftCallbackStoreC', 'float')
-            else:
-                load_types = ('x.x', 'cufftDoubleComplex',
-                              'cufftCallbackLoadZ', 'double')
-                store_types = ('x.y', 'cufftDoubleComplex',
-                               'cufftCallbackStoreZ', 'double')
-        elif fft_func == 'rfftn':
-            if dtype == np.float32:
-                load_types = (
-                    'x', 'cufftReal', 'cufftCallbackLoadR', 'float')
-                store_types = (
-                    'x.y', 'cufftComplex', 'cufftCallbackStoreC', 'float')
-            else:
-                load_types = (
-                    'x', 'cufftDoubleReal', 'cufftCallbackLoadD', 'double')
-                store_types = ('x.y', 'cufftDoubleComplex',
-                               'cufftCallbackStoreZ', 'double')
-        else:  # irfftn
-            if dtype == np.complex64:
-                load_types = (
-                    'x.x', 'cufftComplex', 'cufftCallbackLoadC', 'float')
-                store_types = (
-                    'x', 'cufftReal', 'cufftCallbackStoreR', 'float')
-            else:
-                load_types = ('x.x', 'cufftDoubleComplex',
-                              'cufftCallbackLoadZ', 'double')
-                store_types = ('x', 'cufftDoubleReal',
-                               'cufftCallbackStoreD', 'double')
-        cb_load = _set_load_cb(load_code, *load_types)
-        cb_store = _set_store_cb(store_code, *store_types)
-
-        a = testing.shaped_random(self.shape, xp, dtype)
-        if xp is np:
-            a.real *= 2.5
-            out = fft(a, s=self.s, axes=self.axes, norm=self.norm)
-            if fft_func != 'irfftn':
-                out.imag /= 3.8
-                if dtype in (np.float32, np.complex64):
-                    out = out.astype(np.complex64)
-            else:
-                out /= 3.8
-                if dtype in (np.float32, np.complex64):
-                    out = out.astype(np.float32)
-        else:
-            with use_temporary_cache_dir():
-                with xp.fft.config.set_cufft_callbacks(
-                        cb_load=cb_load, cb_store=cb_store,
-                        cb_load_aux_arr=load_aux, cb_store_aux_arr=store_aux):
-                    out = fft(a, s=self.s, axes=self.axes, norm=self.norm)
-
-        return out
+        return self._run_transform(xp, dtype, 'irfftn', load=True, store=True)
 
+    @testing.slow
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, accept_error=ValueError,
                                  contiguous_check=False)
     def test_fftn_load_store_aux(self, xp, dtype):
-        return self._test_load_store_aux_helper(xp, dtype, 'fftn')
+        return self._run_transform(
+            xp, dtype, 'fftn', load=True, store=True, aux=True)
 
+    @testing.slow
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, accept_error=ValueError,
                                  contiguous_check=False)
     def test_ifftn_load_store_aux(self, xp, dtype):
-        return self._test_load_store_aux_helper(xp, dtype, 'ifftn')
+        return self._run_transform(
+            xp, dtype, 'ifftn', load=True, store=True, aux=True)
 
+    @testing.slow
     @testing.for_float_dtypes(no_float16=True)
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, accept_error=ValueError,
                                  contiguous_check=False)
     def test_rfftn_load_store_aux(self, xp, dtype):
-        return self._test_load_store_aux_helper(xp, dtype, 'rfftn')
+        return self._run_transform(
+            xp, dtype, 'rfftn', load=True, store=True, aux=True)
 
+    @testing.slow
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-7, accept_error=ValueError,
                                  contiguous_check=False)
     def test_irfftn_load_store_aux(self, xp, dtype):
-        return self._test_load_store_aux_helper(xp, dtype, 'irfftn')
+        return self._run_transform(
+            xp, dtype, 'irfftn', load=True, store=True, aux=True)